@@ -5,6 +5,8 @@ import secrets
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from .passwords import DEFAULT_ROUNDS
+
 
 @dataclass
 class AuthConfig:
@@ -25,6 +27,7 @@ class AuthConfig:
 
     # Password policy
     min_password_length: int = 8
+    password_hash_rounds: int = DEFAULT_ROUNDS  # bcrypt cost; lower only in tests
 
     # Token issuer
     issuer: str = "archon"
@@ -8,19 +8,41 @@ from pathlib import Path
 
 from .models import Role, User
 
+_INSERT_USER_SQL = """INSERT INTO users
+   (id, username, email, hashed_password, role, is_active, created_at, updated_at)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+
 
 class UserDatabase:
     """SQLite-backed user storage.
 
     Uses Python's built-in sqlite3 module - no external ORM required.
-    Maintains a single connection for the lifetime of the instance.
+    Maintains a single connection for the lifetime of the instance; pass
+    ``conn`` to share a connection already opened on ``db_path``.
     """
 
-    def __init__(self, db_path: Path | str = ":memory:") -> None:
+    def __init__(
+        self,
+        db_path: Path | str = ":memory:",
+        conn: sqlite3.Connection | None = None,
+    ) -> None:
         self.db_path = str(db_path)
-        self._conn = sqlite3.connect(self.db_path)
+        self._conn = conn if conn is not None else sqlite3.connect(self.db_path)
+        if self.db_path == ":memory:":
+            self._apply_memory_pragmas()
         self._init_schema()
 
+    def _apply_memory_pragmas(self) -> None:
+        """Relax sync, temp-file and locking settings for in-memory databases.
+
+        An in-memory database already journals to memory; nothing survives the
+        connection either, so unsynchronized writes, in-memory temp tables and
+        an exclusive lock cost nothing in safety.
+        """
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+
     def _init_schema(self) -> None:
         """Create tables if they don't exist."""
         self._conn.execute("""
@@ -56,21 +78,7 @@ class UserDatabase:
             ValueError: If username or email already exists.
         """
         try:
-            self._conn.execute(
-                """INSERT INTO users
-                   (id, username, email, hashed_password, role, is_active, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    user.id,
-                    user.username,
-                    user.email,
-                    user.hashed_password,
-                    user.role.value,
-                    int(user.is_active),
-                    user.created_at,
-                    user.updated_at,
-                ),
-            )
+            self._conn.execute(_INSERT_USER_SQL, user.to_row())
             self._conn.commit()
         except sqlite3.IntegrityError as e:
             error_msg = str(e).lower()
@@ -81,6 +89,29 @@ class UserDatabase:
             raise ValueError(f"User already exists: {e}")
         return user
 
+    def bulk_create_users(self, users: list[User]) -> list[User]:
+        """Insert several users in a single transaction.
+
+        All rows are written with one executemany() and one commit, so
+        seeding N users costs a single transaction instead of N.
+
+        Args:
+            users: The User objects to persist.
+
+        Returns:
+            The persisted User objects.
+
+        Raises:
+            ValueError: If any username or email already exists. No users
+                are inserted in that case.
+        """
+        try:
+            with self._conn:
+                self._conn.executemany(_INSERT_USER_SQL, [u.to_row() for u in users])
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"User already exists: {e}")
+        return users
+
     def get_by_username(self, username: str) -> User | None:
         """Find a user by username."""
         row = self._conn.execute(
@@ -151,6 +182,11 @@ class UserDatabase:
         row = self._conn.execute("SELECT COUNT(*) FROM users").fetchone()
         return row[0] if row else 0
 
+    def clear(self) -> None:
+        """Delete all users, leaving the schema in place."""
+        self._conn.execute("DELETE FROM users")
+        self._conn.commit()
+
     def close(self) -> None:
         """Close the database connection."""
         self._conn.close()
@@ -53,6 +53,19 @@ class User:
             "updated_at": self.updated_at,
         }
 
+    def to_row(self) -> tuple[Any, ...]:
+        """Serialize to a database row tuple (inverse of from_row)."""
+        return (
+            self.id,
+            self.username,
+            self.email,
+            self.hashed_password,
+            self.role.value,
+            int(self.is_active),
+            self.created_at,
+            self.updated_at,
+        )
+
     @classmethod
     def from_row(cls, row: tuple[Any, ...]) -> User:
         """Create User from database row tuple."""
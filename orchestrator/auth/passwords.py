@@ -2,12 +2,20 @@
 
 import bcrypt
 
+DEFAULT_ROUNDS = 12
+
 
 class PasswordHasher:
-    """Handles password hashing and verification using bcrypt."""
+    """Handles password hashing and verification using bcrypt.
 
-    @staticmethod
-    def hash(password: str) -> str:
+    Calls the C-backed ``bcrypt`` binding directly; there is no passlib
+    dispatch layer or pure-Python fallback.
+    """
+
+    def __init__(self, rounds: int = DEFAULT_ROUNDS) -> None:
+        self.rounds = rounds
+
+    def hash(self, password: str) -> str:
         """Hash a plaintext password.
 
         Args:
@@ -16,7 +24,7 @@ class PasswordHasher:
         Returns:
             The bcrypt-hashed password string.
         """
-        salt = bcrypt.gensalt(rounds=12)
+        salt = bcrypt.gensalt(rounds=self.rounds)
         hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
         return hashed.decode("utf-8")
 
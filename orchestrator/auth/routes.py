@@ -26,6 +26,7 @@ def create_auth_router(
     config: AuthConfig | None = None,
     db: UserDatabase | None = None,
     token_service: TokenService | None = None,
+    hasher: PasswordHasher | None = None,
 ) -> APIRouter:
     """Create and configure the auth API router.
 
@@ -33,6 +34,7 @@ def create_auth_router(
         config: Auth configuration. Uses defaults if None.
         db: User database. Creates in-memory DB if None.
         token_service: Token service. Creates default if None.
+        hasher: Password hasher. Creates default if None.
 
     Returns:
         Configured FastAPI APIRouter with auth endpoints.
@@ -40,7 +42,7 @@ def create_auth_router(
     config = config or AuthConfig()
     db = db or UserDatabase(config.db_path)
     token_service = token_service or TokenService(config)
-    hasher = PasswordHasher()
+    hasher = hasher or PasswordHasher(rounds=config.password_hash_rounds)
 
     # Initialize shared middleware instances
     init_middleware(token_service, db)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -14,11 +15,30 @@ class TokenError(Exception):
     """Raised when token operations fail."""
 
 
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _numeric_claim(payload: dict[str, Any], claim: str, name: str) -> float | None:
+    value = payload.get(claim)
+    # bool is an int subclass, but a JSON true/false is never a timestamp
+    if value is not None and (isinstance(value, bool) or not isinstance(value, int | float)):
+        raise TokenError(f"Invalid token: {name} claim ({claim}) must be a number")
+    return value
+
+
 class TokenService:
     """Manages JWT access and refresh tokens."""
 
-    def __init__(self, config: AuthConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: AuthConfig | None = None,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
         self.config = config or AuthConfig()
+        # Source of "now" for issuing tokens and checking expiry; injectable
+        # so callers (e.g. tests) can move time without sleeping.
+        self.clock = clock or _utc_now
         # In-memory blacklist for revoked refresh tokens.
         # For a local dev tool this is sufficient; production would use Redis.
         self._revoked_tokens: set[str] = set()
@@ -33,7 +53,7 @@ class TokenService:
         Returns:
             Encoded JWT access token.
         """
-        now = datetime.now(timezone.utc)
+        now = self.clock()
         payload = {
             "sub": user_id,
             "role": role,
@@ -53,7 +73,7 @@ class TokenService:
         Returns:
             Encoded JWT refresh token.
         """
-        now = datetime.now(timezone.utc)
+        now = self.clock()
         payload = {
             "sub": user_id,
             "type": "refresh",
@@ -99,12 +119,24 @@ class TokenService:
                 self.config.secret_key,
                 algorithms=[self.config.algorithm],
                 issuer=self.config.issuer,
+                options={"verify_exp": False, "verify_iat": False, "verify_nbf": False},
             )
-        except jwt.ExpiredSignatureError:
-            raise TokenError("Token has expired")
         except jwt.InvalidTokenError as e:
             raise TokenError(f"Invalid token: {e}")
 
+        # Time claims are checked against self.clock rather than PyJWT's wall
+        # clock, so a service with an injected clock accepts its own tokens
+        now = self.clock().timestamp()
+        iat = _numeric_claim(payload, "iat", "Issued At")
+        if iat is not None and iat > now:
+            raise TokenError("Invalid token: The token is not yet valid (iat)")
+        nbf = _numeric_claim(payload, "nbf", "Not Before")
+        if nbf is not None and nbf > now:
+            raise TokenError("Invalid token: The token is not yet valid (nbf)")
+        exp = _numeric_claim(payload, "exp", "Expiration Time")
+        if exp is not None and exp <= now:
+            raise TokenError("Token has expired")
+
         if payload.get("type") != expected_type:
             raise TokenError(f"Expected {expected_type} token, got {payload.get('type')}")
 
@@ -131,3 +163,7 @@ class TokenService:
             True if the token has been revoked.
         """
         return token in self._revoked_tokens
+
+    def clear_revoked(self) -> None:
+        """Forget all revoked refresh tokens."""
+        self._revoked_tokens.clear()
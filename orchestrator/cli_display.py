@@ -11,6 +11,8 @@ Single source of truth for all terminal output:
 - Progress spinners
 """
 
+import itertools
+import re
 import sys
 from dataclasses import dataclass
 from typing import Literal
@@ -91,7 +93,7 @@ def c(text: str, *colors: str) -> str:
 # =============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TerminalPersonality:
     """Terminal personality definition."""
 
@@ -144,14 +146,12 @@ TERMINAL_PERSONALITIES: dict[str, TerminalPersonality] = {
 def get_terminal_badge(terminal_id: str, include_name: bool = True) -> str:
     """Get a colored badge for a terminal."""
     personality = TERMINAL_PERSONALITIES.get(terminal_id)
-    if not personality:
+    if personality is None:
         return f"[{terminal_id.upper()}]"
 
-    badge = f"[{terminal_id.upper()}]"
     if include_name:
-        badge = f"[{terminal_id.upper()} {personality.name}]"
-
-    return c(badge, personality.color)
+        return c(f"[{terminal_id.upper()} {personality.name}]", personality.color)
+    return c(f"[{terminal_id.upper()}]", personality.color)
 
 
 # =============================================================================
@@ -159,6 +159,18 @@ def get_terminal_badge(terminal_id: str, include_name: bool = True) -> str:
 # =============================================================================
 
 
+# Bar color per 0.2-wide quality band. Attribute names rather than values so
+# that a later Colors.disable() (e.g. --no-color) still takes effect.
+_QUALITY_BAR_COLORS = (
+    "BRIGHT_RED",
+    "BRIGHT_RED",
+    "BRIGHT_YELLOW",
+    "BRIGHT_CYAN",
+    "BRIGHT_GREEN",
+    "BRIGHT_GREEN",
+)
+
+
 def quality_bar(quality: float, width: int = 10) -> str:
     """
     Create a visual quality bar using block characters.
@@ -174,15 +186,8 @@ def quality_bar(quality: float, width: int = 10) -> str:
     filled = int(quality * width)
     empty = width - filled
 
-    # Color based on quality level
-    if quality >= 0.8:
-        bar_color = Colors.BRIGHT_GREEN
-    elif quality >= 0.6:
-        bar_color = Colors.BRIGHT_CYAN
-    elif quality >= 0.4:
-        bar_color = Colors.BRIGHT_YELLOW
-    else:
-        bar_color = Colors.BRIGHT_RED
+    # Color based on quality level (one band per 0.2; 1.0 lands in the last slot)
+    bar_color = getattr(Colors, _QUALITY_BAR_COLORS[int(quality * 5)])
 
     bar = c("=" * filled, bar_color) + c("-" * empty, Colors.DIM)
     return f"[{bar}]"
@@ -314,7 +319,7 @@ def print_terminals_ready(terminals: list[str] | None = None) -> None:
 # =============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TerminalStatus:
     """Status of a single terminal."""
 
@@ -422,7 +427,7 @@ def print_organic_status(
 # =============================================================================
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ContractDisplay:
     """Contract information for display."""
 
@@ -578,13 +583,11 @@ class Spinner:
     FRAMES = ["|", "/", "-", "\\"]
 
     def __init__(self) -> None:
-        self._frame = 0
+        self._frames = itertools.cycle(self.FRAMES)
 
     def next_frame(self) -> str:
         """Get the next spinner frame."""
-        frame = self.FRAMES[self._frame]
-        self._frame = (self._frame + 1) % len(self.FRAMES)
-        return frame
+        return next(self._frames)
 
 
 # =============================================================================
@@ -612,11 +615,12 @@ def show_cursor() -> None:
     print("\033[?25h", end="")
 
 
+_ANSI_RE = re.compile(r"\033\[[0-9;]*m")
+
+
 def strip_ansi(text: str) -> str:
     """Strip ANSI escape codes from text for length calculation."""
-    import re
-
-    return re.sub(r"\033\[[0-9;]*m", "", text)
+    return _ANSI_RE.sub("", text)
 
 
 # =============================================================================
@@ -696,7 +700,7 @@ def get_terminal_name(terminal_id: str) -> str:
     This is the single source of truth -- never hardcode terminal names elsewhere.
     """
     personality = TERMINAL_PERSONALITIES.get(terminal_id)
-    if personality:
+    if personality is not None:
         return personality.name
     return terminal_id.upper()
 
@@ -707,6 +711,6 @@ def get_terminal_color(terminal_id: str) -> str:
     This is the single source of truth -- never hardcode terminal colors elsewhere.
     """
     personality = TERMINAL_PERSONALITIES.get(terminal_id)
-    if personality:
+    if personality is not None:
         return personality.color
     return Colors.WHITE
@@ -5,8 +5,11 @@ Defines terminal roles, subagent mappings, system paths, and project management.
 """
 
 import json
+import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal, TypedDict
 
@@ -363,6 +366,55 @@ TEMP_FILE_PATTERNS = [
 ]
 
 
+# Fixed arguments after the codex binary: non-interactive exec, no colour,
+# never ask for approval, sandboxed to the workspace
+_CODEX_EXEC_ARGS = ("exec", "--color", "never", "-a", "never", "-s", "workspace-write")
+
+# Filesystem mtimes come from a coarse clock tick, so a second change inside
+# the same tick can keep the same mtime. Results keyed on an mtime this close
+# to "now" are not cached (the same "racy" check git applies to its index).
+_MTIME_SETTLE_NS = 1_000_000_000
+
+
+def _mtime_settled(mtime_ns: int) -> bool:
+    """Whether an mtime is old enough to key a cache on."""
+    return time.time_ns() - mtime_ns >= _MTIME_SETTLE_NS
+
+
+@lru_cache(maxsize=32)
+def _read_prompt_template(path: Path, _mtime_ns: int, _size: int, max_chars: int) -> str:
+    """Read a prompt template, truncated to max_chars (0 disables truncation).
+
+    Cached per file version: _mtime_ns and _size are only part of the key, so an
+    edited template is re-read on the next call. Callers bypass the cache
+    (via __wrapped__) while the mtime is not yet settled.
+    """
+    prompt = path.read_text()
+    if max_chars > 0 and len(prompt) > max_chars:
+        truncated = prompt[:max_chars].rstrip()
+        prompt = (
+            f"{truncated}\n\n"
+            "[Prompt truncated to reduce token usage. Keep decisions concise and action-driven.]"
+        )
+    return prompt
+
+
+@lru_cache(maxsize=8)
+def _scan_agent_names(agents_dir: Path, _mtime_ns: int) -> frozenset[str]:
+    """Names of the local agent definitions (*.md) in agents_dir.
+
+    Cached per directory version: adding, removing or renaming a file bumps
+    the directory mtime. Callers bypass the cache while it is not settled.
+    """
+    return frozenset(path.stem for path in agents_dir.glob("*.md"))
+
+
+@lru_cache(maxsize=8)
+def _scan_file_names(directory: Path, _mtime_ns: int) -> frozenset[str]:
+    """File names in directory, cached per directory version like _scan_agent_names."""
+    return frozenset(path.name for path in directory.iterdir() if path.is_file())
+
+
 @dataclass
 class Config:
     """Main orchestrator configuration."""
@@ -460,24 +512,31 @@ class Config:
     def get_terminal_system_prompt_path(self, terminal_id: TerminalID) -> Path:
         """Resolve the prompt path, preferring compact prompts when enabled."""
         prompt_file = self.get_terminal_config(terminal_id).prompt_file
-        compact_path = self.compact_templates_dir / prompt_file
-        if self.compact_prompts and compact_path.exists():
-            return compact_path
+        if self.compact_prompts and prompt_file in self._compact_template_names():
+            return self.compact_templates_dir / prompt_file
         return self.templates_dir / prompt_file
 
+    def _compact_template_names(self) -> frozenset[str]:
+        """Names of the compact prompt templates, rescanned only when the directory changes."""
+        try:
+            mtime_ns = self.compact_templates_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return frozenset()
+        scan = _scan_file_names if _mtime_settled(mtime_ns) else _scan_file_names.__wrapped__
+        return scan(self.compact_templates_dir, mtime_ns)
+
     def load_system_prompt(self, terminal_id: TerminalID) -> str | None:
         """Load and optimize terminal system prompt for token efficiency."""
         prompt_path = self.get_terminal_system_prompt_path(terminal_id)
-        if not prompt_path.exists():
+        try:
+            stat = prompt_path.stat()
+        except FileNotFoundError:
             return None
 
-        prompt = prompt_path.read_text()
-        if self.max_system_prompt_chars > 0 and len(prompt) > self.max_system_prompt_chars:
-            truncated = prompt[: self.max_system_prompt_chars].rstrip()
-            prompt = (
-                f"{truncated}\n\n"
-                "[Prompt truncated to reduce token usage. Keep decisions concise and action-driven.]"
-            )
+        read: Callable[..., str] = _read_prompt_template
+        if not _mtime_settled(stat.st_mtime_ns):
+            read = _read_prompt_template.__wrapped__
+        prompt = read(prompt_path, stat.st_mtime_ns, stat.st_size, self.max_system_prompt_chars)
 
         profile = self.get_terminal_runtime_profile(terminal_id)
         runtime_header = (
@@ -509,16 +568,7 @@ class Config:
         """
         if self.llm_provider == "codex":
             model = self.llm_model or self.codex_default_model
-            cmd = [
-                self.llm_command,
-                "exec",
-                "--color",
-                "never",
-                "-a",
-                "never",
-                "-s",
-                "workspace-write",
-            ]
+            cmd = [self.llm_command, *_CODEX_EXEC_ARGS]
             if allow_unsafe:
                 cmd.append("--dangerously-bypass-approvals-and-sandbox")
             if model:
@@ -539,8 +589,12 @@ class Config:
         subagents: set[str] = set()
         for terminal_cfg in self.terminals.values():
             subagents.update(terminal_cfg.subagents)
-        if self.agents_dir.exists():
-            subagents.update(path.stem for path in self.agents_dir.glob("*.md"))
+        try:
+            mtime_ns = self.agents_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return sorted(subagents)
+        scan = _scan_agent_names if _mtime_settled(mtime_ns) else _scan_agent_names.__wrapped__
+        subagents.update(scan(self.agents_dir, mtime_ns))
         return sorted(subagents)
 
     def route_task_to_terminal(self, task_description: str) -> TerminalID:
@@ -7,9 +7,11 @@ making the negotiation process visible and collaborative.
 """
 
 import re
+from collections.abc import Callable, Collection, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
 from typing import Literal
 
@@ -27,7 +29,62 @@ class ContractStatus(Enum):
     DEPRECATED = "deprecated"  # No longer in use
 
 
-@dataclass
+_STATUS_BY_VALUE = {status.value: status for status in ContractStatus}
+_STATUS_RE = re.compile(r"\*\*Status:\*\*\s*(.+)$", re.MULTILINE)
+_NAME_RE = re.compile(r"^#\s*Contract:\s*(.+)$", re.MULTILINE)
+
+# Markdown headings/labels, shared by rendering and parsing
+_STATUS_LABELS = {
+    ContractStatus.NEGOTIATING: "Negotiating",
+    ContractStatus.AGREED: "Agreed",
+    ContractStatus.IMPLEMENTED: "Implemented",
+    ContractStatus.VERIFIED: "Verified",
+    ContractStatus.DISPUTED: "Disputed",
+    ContractStatus.DEPRECATED: "Deprecated",
+}
+_ACTION_LABELS = {
+    "proposal": "Proposal",
+    "response": "Response",
+    "counter": "Counter-Proposal",
+    "resolution": "Resolution",
+    "implementation": "Implementation",
+    "verification": "Verification",
+    "dispute": "Dispute",
+}
+_ACTIONS_BY_LABEL = {label: action for action, label in _ACTION_LABELS.items()}
+
+# Sections of the contract summary, most in need of attention first
+# (deprecated contracts are counted in the total but not listed)
+_SUMMARY_STATUS_ORDER = (
+    ContractStatus.NEGOTIATING,
+    ContractStatus.DISPUTED,
+    ContractStatus.AGREED,
+    ContractStatus.IMPLEMENTED,
+    ContractStatus.VERIFIED,
+)
+
+# Statuses in which a contract still needs someone to act on it
+_PENDING_STATUSES = frozenset({ContractStatus.NEGOTIATING, ContractStatus.AGREED})
+
+
+# Cheap check on a contract file's raw (content, path) before the full parse
+_HeaderFilter = Callable[[str, Path], bool]
+
+
+def _parse_status(content: str) -> ContractStatus:
+    """Read a contract's status from its markdown header (NEGOTIATING if absent)."""
+    match = _STATUS_RE.search(content)
+    if not match:
+        return ContractStatus.NEGOTIATING
+    return _STATUS_BY_VALUE.get(match.group(1).strip().lower(), ContractStatus.NEGOTIATING)
+
+
+def _has_status(statuses: Collection[ContractStatus]) -> _HeaderFilter:
+    """Header filter accepting contracts whose status is in statuses."""
+    return lambda content, _path: _parse_status(content) in statuses
+
+
+@dataclass(slots=True)
 class NegotiationEntry:
     """A single entry in a contract's negotiation history."""
 
@@ -43,18 +100,8 @@ class NegotiationEntry:
 
     def to_markdown(self) -> str:
         """Format entry as markdown section."""
-        action_labels = {
-            "proposal": "Proposal",
-            "response": "Response",
-            "counter": "Counter-Proposal",
-            "resolution": "Resolution",
-            "implementation": "Implementation",
-            "verification": "Verification",
-            "dispute": "Dispute",
-        }
-
         time_str = self.timestamp.split("T")[1][:5] if "T" in self.timestamp else self.timestamp
-        label = action_labels.get(self.action, self.action.capitalize())
+        label = _ACTION_LABELS.get(self.action, self.action.capitalize())
 
         md = f"### {label} ({self.terminal.upper()} @ {time_str})\n\n"
         md += f"{self.content}\n"
@@ -80,7 +127,7 @@ class NegotiationEntry:
         return md + "\n"
 
 
-@dataclass
+@dataclass(slots=True)
 class Contract:
     """
     A living contract between terminals.
@@ -117,19 +164,10 @@ class Contract:
 
     def to_markdown(self) -> str:
         """Render contract as a complete markdown document."""
-        status_display = {
-            ContractStatus.NEGOTIATING: "Negotiating",
-            ContractStatus.AGREED: "Agreed",
-            ContractStatus.IMPLEMENTED: "Implemented",
-            ContractStatus.VERIFIED: "Verified",
-            ContractStatus.DISPUTED: "Disputed",
-            ContractStatus.DEPRECATED: "Deprecated",
-        }
-
         md = f"# Contract: {self.name}\n\n"
         md += f"**ID:** `{self.id}`\n"
         md += f"**Type:** {self.contract_type}\n"
-        md += f"**Status:** {status_display[self.status]}\n"
+        md += f"**Status:** {_STATUS_LABELS[self.status]}\n"
         md += f"**Proposer:** {self.proposer.upper()}\n"
 
         if self.implementer:
@@ -164,9 +202,8 @@ class Contract:
         """Parse a contract from markdown content."""
         # Extract header info
         id_match = re.search(r"\*\*ID:\*\*\s*`([^`]+)`", content)
-        name_match = re.search(r"^#\s*Contract:\s*(.+)$", content, re.MULTILINE)
+        name_match = _NAME_RE.search(content)
         type_match = re.search(r"\*\*Type:\*\*\s*(.+)$", content, re.MULTILINE)
-        status_match = re.search(r"\*\*Status:\*\*\s*(.+)$", content, re.MULTILINE)
         proposer_match = re.search(r"\*\*Proposer:\*\*\s*(\w+)", content)
         implementer_match = re.search(r"\*\*Implementer:\*\*\s*(\w+)", content)
         created_match = re.search(r"\*\*Created:\*\*\s*(.+)$", content, re.MULTILINE)
@@ -177,17 +214,7 @@ class Contract:
         tags_match = re.search(r"\*\*Tags:\*\*\s*(.+)$", content, re.MULTILINE)
         deps_match = re.search(r"\*\*Dependencies:\*\*\s*(.+)$", content, re.MULTILINE)
 
-        # Parse status
-        status_str = status_match.group(1).strip().lower() if status_match else "negotiating"
-        status_map = {
-            "negotiating": ContractStatus.NEGOTIATING,
-            "agreed": ContractStatus.AGREED,
-            "implemented": ContractStatus.IMPLEMENTED,
-            "verified": ContractStatus.VERIFIED,
-            "disputed": ContractStatus.DISPUTED,
-            "deprecated": ContractStatus.DEPRECATED,
-        }
-        status = status_map.get(status_str, ContractStatus.NEGOTIATING)
+        status = _parse_status(content)
 
         # Parse history entries
         history = []
@@ -199,16 +226,7 @@ class Contract:
                 re.DOTALL,
             )
             for action_label, terminal, time, body in entries:
-                action_map = {
-                    "Proposal": "proposal",
-                    "Response": "response",
-                    "Counter-Proposal": "counter",
-                    "Resolution": "resolution",
-                    "Implementation": "implementation",
-                    "Verification": "verification",
-                    "Dispute": "dispute",
-                }
-                action = action_map.get(action_label, "response")
+                action = _ACTIONS_BY_LABEL.get(action_label, "response")
 
                 # Extract code block if present
                 code_match = re.search(r"```\w*\n(.*?)```", body, re.DOTALL)
@@ -279,20 +297,25 @@ class ContractManager:
     6. T5 verifies and marks VERIFIED
     """
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, clock: Callable[[], datetime] | None = None):
         """
         Initialize the ContractManager.
 
         Args:
             config: Orchestrator configuration
+            clock: Source of "now" for contract IDs and timestamps
+                (defaults to datetime.now; tests can inject a fake)
         """
         self.config = config
+        self.clock = clock or datetime.now
+        # Resolved once; every lookup and scan joins onto it
+        self._contracts_dir = config.orchestra_dir / "contracts"
         self._ensure_dirs()
 
     @property
     def contracts_dir(self) -> Path:
         """Get the contracts directory."""
-        return self.config.orchestra_dir / "contracts"
+        return self._contracts_dir
 
     @property
     def templates_dir(self) -> Path:
@@ -305,9 +328,18 @@ class ContractManager:
 
     def _generate_contract_id(self, name: str) -> str:
         """Generate a unique contract ID."""
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        timestamp = self.clock().strftime("%Y%m%d%H%M%S")
         safe_name = re.sub(r"[^a-zA-Z0-9]", "", name)[:20].lower()
-        return f"contract_{safe_name}_{timestamp}"
+        contract_id = f"contract_{safe_name}_{timestamp}"
+
+        # Names that sanitize alike ("User Profile" / "UserProfile") proposed
+        # within the same second must not overwrite each other's file
+        suffix = 2
+        unique_id = contract_id
+        while self._get_contract_path(unique_id).exists():
+            unique_id = f"{contract_id}_{suffix}"
+            suffix += 1
+        return unique_id
 
     def _get_contract_path(self, contract_id: str) -> Path:
         """Get the path to a contract file."""
@@ -358,7 +390,7 @@ class ContractManager:
             )
 
         contract_id = self._generate_contract_id(name)
-        now = datetime.now().isoformat()
+        now = self.clock().isoformat()
 
         # Create initial proposal entry
         proposal = NegotiationEntry(
@@ -426,7 +458,7 @@ class ContractManager:
                 f"Contract '{contract_id}' is {contract.status.value} and cannot be modified"
             )
 
-        now = datetime.now().isoformat()
+        now = self.clock().isoformat()
 
         # Map action to entry type
         action_map = {
@@ -493,7 +525,7 @@ class ContractManager:
         if not contract:
             raise ValueError(f"Contract '{contract_id}' not found")
 
-        now = datetime.now().isoformat()
+        now = self.clock().isoformat()
 
         entry = NegotiationEntry(
             terminal=terminal,
@@ -549,7 +581,7 @@ class ContractManager:
             # Allow implementation even from NEGOTIATING for rapid iteration
             pass
 
-        now = datetime.now().isoformat()
+        now = self.clock().isoformat()
 
         metadata = {}
         if file_path:
@@ -602,7 +634,7 @@ class ContractManager:
         if not contract:
             raise ValueError(f"Contract '{contract_id}' not found")
 
-        now = datetime.now().isoformat()
+        now = self.clock().isoformat()
 
         entry = NegotiationEntry(
             terminal=terminal,
@@ -663,9 +695,15 @@ class ContractManager:
             Contract object if exists, None otherwise
         """
         name_lower = name.lower()
+
+        def has_name(content: str, path: Path) -> bool:
+            name_match = _NAME_RE.search(content)
+            title = name_match.group(1).strip() if name_match else path.stem
+            return title.lower() == name_lower
+
         for path in self.contracts_dir.glob("*.md"):
-            contract = self._load_contract(path)
-            if contract and contract.name.lower() == name_lower:
+            contract = self._load_contract(path, has_name)
+            if contract:
                 return contract
         return None
 
@@ -688,14 +726,8 @@ class ContractManager:
         """
         contracts = []
 
-        for path in self.contracts_dir.glob("*.md"):
-            contract = self._load_contract(path)
-            if not contract:
-                continue
-
+        for contract in self._iter_contracts(_has_status({status}) if status else None):
             # Apply filters
-            if status and contract.status != status:
-                continue
             if terminal and terminal not in [contract.proposer, contract.implementer]:
                 continue
             if contract_type and contract.contract_type != contract_type:
@@ -704,7 +736,7 @@ class ContractManager:
             contracts.append(contract)
 
         # Sort by updated_at descending
-        contracts.sort(key=lambda c: c.updated_at, reverse=True)
+        contracts.sort(key=attrgetter("updated_at"), reverse=True)
         return contracts
 
     def list_pending_contracts(self, for_terminal: TerminalID | None = None) -> list[Contract]:
@@ -719,21 +751,25 @@ class ContractManager:
         """
         pending = []
 
-        for contract in self.list_contracts():
-            if contract.status in [ContractStatus.NEGOTIATING, ContractStatus.AGREED]:
-                if for_terminal:
-                    # Check if this terminal should act on this contract
-                    if contract.proposer == for_terminal:
-                        continue  # Proposer is waiting for response
-                    if (
-                        contract.status == ContractStatus.AGREED
-                        and contract.implementer == for_terminal
-                    ):
-                        pending.append(contract)  # Should implement
-                    elif contract.status == ContractStatus.NEGOTIATING:
-                        pending.append(contract)  # Can respond
-                else:
-                    pending.append(contract)
+        contracts = sorted(
+            self._iter_contracts(_has_status(_PENDING_STATUSES)),
+            key=attrgetter("updated_at"),
+            reverse=True,
+        )
+        for contract in contracts:
+            if for_terminal:
+                # Check if this terminal should act on this contract
+                if contract.proposer == for_terminal:
+                    continue  # Proposer is waiting for response
+                if (
+                    contract.status == ContractStatus.AGREED
+                    and contract.implementer == for_terminal
+                ):
+                    pending.append(contract)  # Should implement
+                elif contract.status == ContractStatus.NEGOTIATING:
+                    pending.append(contract)  # Can respond
+            else:
+                pending.append(contract)
 
         return pending
 
@@ -791,24 +827,10 @@ class ContractManager:
         lines = ["# Contract Summary\n"]
         lines.append(f"**Total:** {len(contracts)} contracts\n")
 
-        for status in [
-            ContractStatus.NEGOTIATING,
-            ContractStatus.DISPUTED,
-            ContractStatus.AGREED,
-            ContractStatus.IMPLEMENTED,
-            ContractStatus.VERIFIED,
-        ]:
+        for status in _SUMMARY_STATUS_ORDER:
             status_contracts = by_status[status]
             if status_contracts:
-                emoji_map = {
-                    ContractStatus.NEGOTIATING: "Negotiating",
-                    ContractStatus.DISPUTED: "Disputed",
-                    ContractStatus.AGREED: "Agreed",
-                    ContractStatus.IMPLEMENTED: "Implemented",
-                    ContractStatus.VERIFIED: "Verified",
-                }
-
-                lines.append(f"\n## {emoji_map[status]} ({len(status_contracts)})\n")
+                lines.append(f"\n## {_STATUS_LABELS[status]} ({len(status_contracts)})\n")
 
                 for contract in status_contracts:
                     lines.append(
@@ -846,15 +868,31 @@ class ContractManager:
         path.write_text(contract.to_markdown())
         return path
 
-    def _load_contract(self, path: Path) -> Contract | None:
-        """Load a contract from disk."""
+    def _load_contract(
+        self, path: Path, header_filter: _HeaderFilter | None = None
+    ) -> Contract | None:
+        """
+        Load a contract from disk.
+
+        If header_filter is given and rejects the raw file content, the
+        contract is skipped (None) without parsing its negotiation history.
+        """
         try:
             content = path.read_text()
+            if header_filter is not None and not header_filter(content, path):
+                return None
             return Contract.from_markdown(content, path)
         except Exception as e:
             print(f"[ContractManager] Error loading {path}: {e}")
             return None
 
+    def _iter_contracts(self, header_filter: _HeaderFilter | None = None) -> Iterator[Contract]:
+        """Yield every loadable contract on disk, optionally only those header_filter accepts."""
+        for path in self.contracts_dir.glob("*.md"):
+            contract = self._load_contract(path, header_filter)
+            if contract:
+                yield contract
+
     def delete_contract(self, contract_id: str) -> bool:
         """
         Delete a contract.
@@ -891,7 +929,7 @@ class ContractManager:
         if not contract:
             return None
 
-        now = datetime.now().isoformat()
+        now = self.clock().isoformat()
 
         entry = NegotiationEntry(
             terminal="orchestrator",
@@ -272,6 +272,11 @@ class ResourceDatabase:
             )
         self._conn.commit()
 
+    def clear(self) -> None:
+        """Delete all resources, leaving the schema in place."""
+        self._conn.execute("DELETE FROM resources")
+        self._conn.commit()
+
     def list_resources(self, page: int = 1, per_page: int = 20) -> dict[str, Any]:
         """Return paginated resources."""
         total = self._conn.execute("SELECT COUNT(*) FROM resources").fetchone()[0]
@@ -310,7 +315,7 @@ class LiveAPIState:
         db_path: Path | str | None = None,
     ) -> None:
         self.auth_config = auth_config or AuthConfig()
-        self.hasher = PasswordHasher()
+        self.hasher = PasswordHasher(rounds=self.auth_config.password_hash_rounds)
         self.token_service = TokenService(self.auth_config)
 
         # Single SQLite connection for both users and resources
@@ -319,13 +324,16 @@ class LiveAPIState:
             Path(resolved_path).parent.mkdir(parents=True, exist_ok=True)
         self._conn = sqlite3.connect(resolved_path)
 
-        self.user_db = UserDatabase.__new__(UserDatabase)
-        self.user_db.db_path = resolved_path
-        self.user_db._conn = self._conn
-        self.user_db._init_schema()
+        self.user_db = UserDatabase(resolved_path, conn=self._conn)
 
         self.resource_db = ResourceDatabase(self._conn)
 
+    def reset(self) -> None:
+        """Empty the user and resource tables and forget revoked refresh tokens."""
+        self.user_db.clear()
+        self.resource_db.clear()
+        self.token_service.clear_revoked()
+
 
 _state: LiveAPIState | None = None
 
@@ -4,14 +4,48 @@ Message Bus for inter-terminal communication.
 Uses file-based messaging in .orchestra/messages/ for coordination.
 """
 
+import fcntl
+import itertools
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 from typing import Literal
 
 from .config import Config, TerminalID
 
 MessageType = Literal["request", "response", "broadcast", "status", "artifact", "intervention"]
 
+_INBOX_HEADER = "# Inbox\n\n"
+_INBOX_PLACEHOLDER = _INBOX_HEADER + "No messages yet.\n"
+_BROADCAST_HEADER = "# Broadcast Channel\n\n"
+_BROADCAST_PLACEHOLDER = _BROADCAST_HEADER + "No broadcasts yet.\n"
+
+# Message IDs are "<process prefix>_<seq>"; the sequence is shared by every bus
+# in the process, and the start time + pid keep processes apart
+_ID_PREFIX = f"msg_{datetime.now():%Y%m%d%H%M%S}_{os.getpid():x}"
+_ID_SEQ = itertools.count(1)
+
+
+def _append_message(path: Path, header: str, placeholder: str, payload: bytes) -> None:
+    """Append an encoded message to a message file.
+
+    A file that still holds only its placeholder is rewritten as header +
+    message; otherwise the message is appended without reading the file.
+    The check and the write happen under an exclusive flock on the same fd,
+    so concurrent senders cannot drop each other's messages.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        size = os.fstat(fd).st_size
+        if size == len(placeholder) and os.pread(fd, size, 0) == placeholder.encode():
+            os.ftruncate(fd, 0)
+            payload = header.encode() + payload
+        os.write(fd, payload)
+    finally:
+        os.close(fd)  # Also releases the lock
+
 
 @dataclass
 class Message:
@@ -63,7 +97,6 @@ class MessageBus:
 
     def __init__(self, config: Config):
         self.config = config
-        self._message_counter = 0
         self._ensure_files()
 
     def _ensure_files(self) -> None:
@@ -74,18 +107,16 @@ class MessageBus:
         for tid in ["t1", "t2", "t3", "t4", "t5"]:
             inbox = self.config.get_terminal_inbox(tid)  # type: ignore
             if not inbox.exists():
-                inbox.write_text("# Inbox\n\nNo messages yet.\n")
+                inbox.write_text(_INBOX_PLACEHOLDER)
 
         # Create broadcast file
         broadcast = self.config.get_broadcast_file()
         if not broadcast.exists():
-            broadcast.write_text("# Broadcast Channel\n\nNo broadcasts yet.\n")
+            broadcast.write_text(_BROADCAST_PLACEHOLDER)
 
     def _generate_message_id(self) -> str:
         """Generate a unique message ID."""
-        self._message_counter += 1
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        return f"msg_{timestamp}_{self._message_counter:04d}"
+        return f"{_ID_PREFIX}_{next(_ID_SEQ):04d}"
 
     def send(
         self,
@@ -105,36 +136,27 @@ class MessageBus:
             metadata=metadata or {},
         )
 
+        # Format and encode once; a broadcast writes the same bytes to six files
+        payload = msg.to_markdown().encode()
         if recipient == "all":
-            self._append_to_broadcast(msg)
+            self._append_to_broadcast(payload)
             # Also append to each terminal's inbox
             for tid in ["t1", "t2", "t3", "t4", "t5"]:
-                self._append_to_inbox(tid, msg)  # type: ignore
+                self._append_to_inbox(tid, payload)  # type: ignore
         else:
-            self._append_to_inbox(recipient, msg)  # type: ignore
+            self._append_to_inbox(recipient, payload)  # type: ignore
 
         return msg
 
-    def _append_to_inbox(self, terminal_id: TerminalID, msg: Message) -> None:
-        """Append a message to a terminal's inbox."""
+    def _append_to_inbox(self, terminal_id: TerminalID, payload: bytes) -> None:
+        """Append an encoded message to a terminal's inbox."""
         inbox = self.config.get_terminal_inbox(terminal_id)
-        current = inbox.read_text() if inbox.exists() else ""
-
-        # Remove "No messages yet." if present
-        if "No messages yet." in current:
-            current = "# Inbox\n\n"
-
-        inbox.write_text(current + msg.to_markdown())
+        _append_message(inbox, _INBOX_HEADER, _INBOX_PLACEHOLDER, payload)
 
-    def _append_to_broadcast(self, msg: Message) -> None:
-        """Append a message to the broadcast channel."""
+    def _append_to_broadcast(self, payload: bytes) -> None:
+        """Append an encoded message to the broadcast channel."""
         broadcast = self.config.get_broadcast_file()
-        current = broadcast.read_text() if broadcast.exists() else ""
-
-        if "No broadcasts yet." in current:
-            current = "# Broadcast Channel\n\n"
-
-        broadcast.write_text(current + msg.to_markdown())
+        _append_message(broadcast, _BROADCAST_HEADER, _BROADCAST_PLACEHOLDER, payload)
 
     def read_inbox(self, terminal_id: TerminalID) -> str:
         """Read a terminal's inbox content."""
@@ -149,7 +171,7 @@ class MessageBus:
     def clear_inbox(self, terminal_id: TerminalID) -> None:
         """Clear a terminal's inbox after processing."""
         inbox = self.config.get_terminal_inbox(terminal_id)
-        inbox.write_text("# Inbox\n\nNo messages yet.\n")
+        inbox.write_text(_INBOX_PLACEHOLDER)
 
     def clear_all(self) -> None:
         """Clear all message files."""
@@ -157,7 +179,7 @@ class MessageBus:
             self.clear_inbox(tid)  # type: ignore
 
         broadcast = self.config.get_broadcast_file()
-        broadcast.write_text("# Broadcast Channel\n\nNo broadcasts yet.\n")
+        broadcast.write_text(_BROADCAST_PLACEHOLDER)
 
     def broadcast_status(self, status: str, metadata: dict | None = None) -> Message:
         """Broadcast a status update to all terminals."""
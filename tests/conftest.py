@@ -12,35 +12,23 @@ Provides common setup for:
 - Live API test client
 """
 
-import tempfile
-<<<<<<< ours
 from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Generator
-=======
-from collections.abc import Generator
-from datetime import datetime
-from pathlib import Path
->>>>>>> theirs
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-<<<<<<< ours
 from orchestrator.auth.config import AuthConfig
 from orchestrator.auth.database import UserDatabase
 from orchestrator.auth.models import Role, User
 from orchestrator.auth.passwords import PasswordHasher
 from orchestrator.auth.tokens import TokenService
-from orchestrator.config import Config, TerminalConfig, TerminalID
-from orchestrator.contract_manager import Contract, ContractManager, ContractStatus
-from orchestrator.dashboard import app as dashboard_app
-=======
 from orchestrator.config import Config, TerminalID
 from orchestrator.contract_manager import Contract, ContractManager
->>>>>>> theirs
+from orchestrator.dashboard import app as dashboard_app
 from orchestrator.manager_intelligence import (
     ManagerIntelligence,
     TerminalHeartbeat,
@@ -48,16 +36,24 @@ from orchestrator.manager_intelligence import (
 from orchestrator.report_manager import Report, ReportManager
 from orchestrator.task_queue import FlowState, Task, TaskPriority, TaskQueue, TaskStatus
 
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+    from orchestrator.live_api import LiveAPIState
+
 # =============================================================================
 # Base Fixtures
 # =============================================================================
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_dir(tmp_path: Path) -> Path:
+    """Create a temporary directory for test files.
+
+    Backed by pytest's tmp_path: unique per test, under a per-worker base
+    directory with pytest-xdist, and kept after a failure for inspection.
+    """
+    return tmp_path
 
 
 @pytest.fixture
@@ -452,13 +448,14 @@ def auth_config() -> AuthConfig:
         refresh_token_expire_days=1,
         db_path=":memory:",
         min_password_length=8,
+        password_hash_rounds=4,
     )
 
 
 @pytest.fixture
-def hasher() -> PasswordHasher:
-    """Password hasher instance."""
-    return PasswordHasher()
+def hasher(auth_config: AuthConfig) -> PasswordHasher:
+    """Password hasher at the test config's (minimum) bcrypt cost."""
+    return PasswordHasher(rounds=auth_config.password_hash_rounds)
 
 
 @pytest.fixture
@@ -554,44 +551,99 @@ def get_token(
     return _get
 
 
-@pytest.fixture
-async def live_api_client():
-    """Async HTTP client for the contract-compliant live API.
-
-    Creates a fresh FastAPI app with in-memory SQLite on each invocation.
-
-    Usage::
+@pytest.fixture(scope="session")
+def live_api_env(memoized_hasher: PasswordHasher) -> "tuple[FastAPI, LiveAPIState]":
+    """Live API app and its state, built once per session.
 
-        async def test_health(live_api_client):
-            resp = await live_api_client.get("/api/v1/health")
-            assert resp.status_code == 200
+    Route registration and schema setup are done once; ``live_api_client``
+    resets the state per test. Registrations reuse a handful of fixed
+    passwords, so the app gets the memoized hasher.
     """
-    from orchestrator.live_api import create_live_api
+    from orchestrator import live_api
 
     auth_cfg = AuthConfig(
-        secret_key="live-api-conftest-secret",
+        secret_key="live-api-conftest-secret-key-min-32bytes",
         access_token_expire_minutes=30,
         refresh_token_expire_days=7,
         db_path=":memory:",
         min_password_length=8,
+        password_hash_rounds=4,
     )
-    app = create_live_api(auth_config=auth_cfg, db_path=":memory:")
+    app = live_api.create_live_api(auth_config=auth_cfg, db_path=":memory:")
+    state = live_api.get_state()
+    state.hasher = memoized_hasher
+    return app, state
+
+
+@pytest.fixture(scope="session")
+async def live_api_session_client(live_api_env: "tuple[FastAPI, LiveAPIState]"):
+    """One AsyncClient over the shared live API app for the whole session."""
+    app, _ = live_api_env
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         yield client
 
 
 @pytest.fixture
-async def auth_routes_client():
-    """Async HTTP client for the auth routes (register/login/refresh/logout/me).
+def live_api_client(
+    live_api_session_client: AsyncClient,
+    live_api_env: "tuple[FastAPI, LiveAPIState]",
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncClient:
+    """Async HTTP client for the contract-compliant live API.
 
-    Uses the ``orchestrator.auth.routes`` router mounted on a minimal FastAPI app.
+    The app and client live for the session; users, resources and revoked
+    tokens are reset per test. The module-level state is pointed back at
+    this app's in case another create_live_api() call rebound it.
 
     Usage::
 
-        async def test_register(auth_routes_client):
-            resp = await auth_routes_client.post("/auth/register", json={...})
-            assert resp.status_code == 201
+        async def test_health(live_api_client):
+            resp = await live_api_client.get("/api/v1/health")
+            assert resp.status_code == 200
+    """
+    from orchestrator import live_api
+
+    _, state = live_api_env
+    state.reset()
+    monkeypatch.setattr(live_api, "_state", state)
+    return live_api_session_client
+
+
+class _MemoizedHasher(PasswordHasher):
+    """Minimum-cost bcrypt hasher that hashes each distinct password once.
+
+    Salt uniqueness doesn't matter to route tests, only that verify()
+    succeeds for the same password, so repeated registrations of the shared
+    fixture password reuse one cached hash.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(rounds=4)
+        self._hashes: dict[str, str] = {}
+
+    def hash(self, password: str) -> str:
+        if password not in self._hashes:
+            self._hashes[password] = super().hash(password)
+        return self._hashes[password]
+
+
+@pytest.fixture(scope="session")
+def memoized_hasher() -> PasswordHasher:
+    """Session-wide minimum-cost hasher that hashes each distinct password once."""
+    return _MemoizedHasher()
+
+
+@pytest.fixture(scope="session")
+def auth_routes_env(memoized_hasher: PasswordHasher) -> dict[str, Any]:
+    """Auth-routes app and its services, built once per session.
+
+    Returns dict with ``app``, ``config``, ``db``, ``token_service``, and
+    ``hasher`` keys.
+    Router registration and error-handler setup are done once; use
+    ``auth_routes_reset`` (or ``auth_routes_client``) to get a clean state.
+    Under pytest-xdist every worker process builds its own app and
+    in-memory database, so workers never share auth state.
     """
     from fastapi import FastAPI
 
@@ -599,7 +651,7 @@ async def auth_routes_client():
     from orchestrator.auth.routes import create_auth_router
 
     cfg = AuthConfig(
-        secret_key="auth-routes-conftest-secret",
+        secret_key="auth-routes-conftest-secret-key-fixed",
         access_token_expire_minutes=30,
         refresh_token_expire_days=7,
         db_path=":memory:",
@@ -609,21 +661,72 @@ async def auth_routes_client():
     ts = TokenService(cfg)
     app = FastAPI()
     register_error_handlers(app)
-    app.include_router(create_auth_router(config=cfg, db=db, token_service=ts))
-    transport = ASGITransport(app=app)
+    hasher = memoized_hasher
+    app.include_router(create_auth_router(config=cfg, db=db, token_service=ts, hasher=hasher))
+    # Sign and verify one token up front so PyJWT's one-off setup (algorithm
+    # registry, key preparation) is paid here rather than inside the first test.
+    ts.decode_token(ts.create_access_token("warmup", "viewer"))
+    return {"app": app, "config": cfg, "db": db, "token_service": ts, "hasher": hasher}
+
+
+@pytest.fixture
+def auth_routes_reset(
+    auth_routes_env: dict[str, Any],
+    auth_routes_session_client: AsyncClient,
+) -> dict[str, Any]:
+    """Reset the shared auth-routes app to a clean state for one test.
+
+    Empties the user table and revocation list, and points the auth
+    middleware back at this app's services in case another router rebound them.
+    Returns the ``auth_routes_env`` dict plus the session ``client``.
+    """
+    from orchestrator.auth.middleware import init_middleware
+
+    db = auth_routes_env["db"]
+    ts = auth_routes_env["token_service"]
+    db.clear()
+    ts.clear_revoked()
+    init_middleware(ts, db)
+    return auth_routes_env | {"client": auth_routes_session_client}
+
+
+@pytest.fixture(scope="session")
+async def auth_routes_session_client(auth_routes_env: dict[str, Any]):
+    """One AsyncClient over the shared auth-routes app for the whole session."""
+    transport = ASGITransport(app=auth_routes_env["app"])
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         yield client
 
 
+@pytest.fixture
+def auth_routes_client(auth_routes_reset: dict[str, Any]) -> AsyncClient:
+    """Async HTTP client for the auth routes (register/login/refresh/logout/me).
+
+    Uses the ``orchestrator.auth.routes`` router mounted on a minimal FastAPI app.
+    The app and client live for the session; the database and revoked tokens
+    are reset per test.
+
+    Usage::
+
+        async def test_register(auth_routes_client):
+            resp = await auth_routes_client.post("/auth/register", json={...})
+            assert resp.status_code == 201
+    """
+    return auth_routes_reset["client"]
+
+
 # =============================================================================
 # Dashboard API Client Fixtures
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def api_client():
     """Async HTTP client for testing dashboard API endpoints.
 
+    The dashboard app is a module-level singleton, so one client serves the
+    whole session.
+
     Usage:
         async def test_status(api_client):
             response = await api_client.get("/api/status")
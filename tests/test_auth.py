@@ -1,99 +1,73 @@
 """Tests for the auth module - passwords, tokens, database, RBAC, and routes."""
 
-import time
+from datetime import UTC, datetime, timedelta
 
+import jwt
 import pytest
 
 from orchestrator.auth.config import AuthConfig
-from orchestrator.auth.database import UserDatabase
 from orchestrator.auth.models import Role, User, UserCreate
 from orchestrator.auth.passwords import PasswordHasher
 from orchestrator.auth.tokens import TokenError, TokenService
 
 
 # ---------------------------------------------------------------------------
-# Fixtures
+# Password Hashing Tests
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def auth_config():
-    """Auth config with short expiration for fast tests."""
-    return AuthConfig(
-        secret_key="test-secret-key-for-unit-tests-min32b",
-        access_token_expire_minutes=1,
-        refresh_token_expire_days=1,
-        db_path=":memory:",
-        min_password_length=8,
-    )
-
-
-@pytest.fixture
-def hasher():
-    return PasswordHasher()
-
-
-@pytest.fixture
-def token_service(auth_config):
-    return TokenService(auth_config)
-
-
-@pytest.fixture
-def db():
-    """In-memory database for each test."""
-    return UserDatabase(":memory:")
-
-
-@pytest.fixture
-def sample_user(hasher):
-    """A pre-built user with known password."""
-    return User(
-        username="testuser",
-        email="test@example.com",
-        hashed_password=hasher.hash("SecurePass123"),
-        role=Role.VIEWER,
-    )
+_UNICODE_PASSWORD = "p\u00e4ssw\u00f6rd\U0001f512"
 
 
-# ---------------------------------------------------------------------------
-# Password Hashing Tests
-# ---------------------------------------------------------------------------
+@pytest.fixture(scope="class")
+def password_hashes():
+    """bcrypt hash of each password the hasher tests verify, computed once per class."""
+    hasher = PasswordHasher(rounds=4)
+    return {pwd: hasher.hash(pwd) for pwd in ("correctpassword", "", _UNICODE_PASSWORD)}
 
 
 class TestPasswordHasher:
-    def test_hash_returns_bcrypt_string(self, hasher):
-        hashed = hasher.hash("mypassword")
+    def test_hash_returns_bcrypt_string(self, password_hashes):
+        hashed = password_hashes["correctpassword"]
         assert hashed.startswith("$2b$")
         assert len(hashed) == 60
 
-    def test_verify_correct_password(self, hasher):
-        hashed = hasher.hash("correctpassword")
-        assert hasher.verify("correctpassword", hashed) is True
+    def test_rounds_encoded_in_hash(self):
+        hashed = PasswordHasher(rounds=4).hash("mypassword")
+        assert hashed.startswith("$2b$04$")
+        assert PasswordHasher.verify("mypassword", hashed) is True
 
-    def test_verify_wrong_password(self, hasher):
-        hashed = hasher.hash("correctpassword")
-        assert hasher.verify("wrongpassword", hashed) is False
+    @pytest.mark.parametrize(
+        "password",
+        ["correctpassword", "", _UNICODE_PASSWORD],
+        ids=["ascii", "empty", "unicode"],
+    )
+    def test_verify_matching_password(self, hasher, password_hashes, password):
+        assert hasher.verify(password, password_hashes[password]) is True
+
+    def test_verify_wrong_password(self, hasher, password_hashes):
+        assert hasher.verify("wrongpassword", password_hashes["correctpassword"]) is False
 
     def test_hash_is_unique_per_call(self, hasher):
         h1 = hasher.hash("same_password")
         h2 = hasher.hash("same_password")
         assert h1 != h2  # Different salts
 
-    def test_empty_password_still_hashes(self, hasher):
-        hashed = hasher.hash("")
-        assert hasher.verify("", hashed) is True
-
-    def test_unicode_password(self, hasher):
-        pwd = "p\u00e4ssw\u00f6rd\U0001f512"
-        hashed = hasher.hash(pwd)
-        assert hasher.verify(pwd, hashed) is True
-
 
 # ---------------------------------------------------------------------------
 # Token Service Tests
 # ---------------------------------------------------------------------------
 
 
+_FROZEN_TS = 1_700_000_000
+
+
+def _signed_access_token(config: AuthConfig, **claims) -> str:
+    """Sign an access token with hand-picked time claims."""
+    payload = {"sub": "user1", "type": "access", "iss": config.issuer, **claims}
+    return jwt.encode(payload, config.secret_key, algorithm=config.algorithm)
+
+
 class TestTokenService:
     def test_create_access_token(self, token_service):
         token = token_service.create_access_token("user123", "admin")
@@ -128,18 +102,75 @@ class TestTokenService:
         with pytest.raises(TokenError, match="Invalid token"):
             token_service.decode_token(tampered)
 
+    def test_malformed_token_rejected(self, token_service):
+        with pytest.raises(TokenError, match="Invalid token"):
+            token_service.decode_token("not.a.valid.jwt", expected_type="refresh")
+
     def test_expired_token_rejected(self):
         config = AuthConfig(
             secret_key="test-key-for-expiry-check-min32bytes",
             access_token_expire_minutes=0,  # Immediate expiration
         )
-        svc = TokenService(config)
+        now = [datetime.now(UTC)]
+        svc = TokenService(config, clock=lambda: now[0])
+        token = svc.create_access_token("user1", "viewer")
+        now[0] += timedelta(seconds=1)
+        with pytest.raises(TokenError, match="expired"):
+            svc.decode_token(token)
+
+    def test_token_valid_until_clock_passes_expiry(self, auth_config):
+        now = [datetime.now(UTC)]
+        svc = TokenService(auth_config, clock=lambda: now[0])
         token = svc.create_access_token("user1", "viewer")
-        # Token is already expired (0 minutes)
-        time.sleep(0.1)
+        now[0] += timedelta(seconds=59)
+        assert svc.decode_token(token)["sub"] == "user1"
+        now[0] += timedelta(seconds=1)
         with pytest.raises(TokenError, match="expired"):
             svc.decode_token(token)
 
+    def test_clock_ahead_of_wall_time_accepts_own_tokens(self, auth_config):
+        ahead = datetime.now(UTC) + timedelta(hours=1)
+        svc = TokenService(auth_config, clock=lambda: ahead)
+        token = svc.create_access_token("user1", "viewer")
+        assert svc.decode_token(token)["sub"] == "user1"
+
+    def test_token_issued_after_clock_rejected(self, auth_config):
+        now = [datetime.now(UTC) + timedelta(hours=1)]
+        svc = TokenService(auth_config, clock=lambda: now[0])
+        token = svc.create_access_token("user1", "viewer")
+        now[0] -= timedelta(hours=1)
+        with pytest.raises(TokenError, match="not yet valid"):
+            svc.decode_token(token)
+
+    @pytest.mark.parametrize(
+        ("claim", "offset", "error"),
+        [
+            ("exp", 0, "expired"),
+            ("exp", 1, None),
+            ("iat", 0, None),
+            ("iat", 1, "not yet valid"),
+            ("nbf", 0, None),
+            ("nbf", 1, "not yet valid"),
+        ],
+    )
+    def test_time_claim_boundaries(self, auth_config, claim, offset, error):
+        now = datetime.fromtimestamp(_FROZEN_TS, UTC)
+        svc = TokenService(auth_config, clock=lambda: now)
+        token = _signed_access_token(auth_config, **{claim: _FROZEN_TS + offset})
+        if error is None:
+            assert svc.decode_token(token)["sub"] == "user1"
+        else:
+            with pytest.raises(TokenError, match=error):
+                svc.decode_token(token)
+
+    @pytest.mark.parametrize("claim", ["exp", "iat", "nbf"])
+    @pytest.mark.parametrize("value", ["soon", True, False])
+    def test_non_numeric_time_claim_rejected(self, auth_config, claim, value):
+        svc = TokenService(auth_config, clock=lambda: datetime.fromtimestamp(_FROZEN_TS, UTC))
+        token = _signed_access_token(auth_config, **{claim: value})
+        with pytest.raises(TokenError, match="must be a number"):
+            svc.decode_token(token)
+
     def test_create_token_pair(self, token_service):
         pair = token_service.create_token_pair("user1", "admin")
         assert "access_token" in pair
@@ -157,6 +188,12 @@ class TestTokenService:
         with pytest.raises(TokenError, match="revoked"):
             token_service.decode_token(token, expected_type="refresh")
 
+    def test_clear_revoked(self, token_service):
+        token = token_service.create_refresh_token("user1")
+        token_service.revoke_refresh_token(token)
+        token_service.clear_revoked()
+        assert token_service.is_revoked(token) is False
+
     def test_different_secret_rejects_token(self):
         svc1 = TokenService(AuthConfig(secret_key="secret-one-that-is-at-least-32bytes"))
         svc2 = TokenService(AuthConfig(secret_key="secret-two-that-is-at-least-32bytes"))
@@ -171,33 +208,33 @@ class TestTokenService:
 
 
 class TestUserDatabase:
-    def test_create_and_retrieve_user(self, db, sample_user):
-        db.create_user(sample_user)
-        found = db.get_by_username("testuser")
+    def test_create_and_retrieve_user(self, user_db, sample_user):
+        user_db.create_user(sample_user)
+        found = user_db.get_by_username("testuser")
         assert found is not None
         assert found.username == "testuser"
         assert found.email == "test@example.com"
         assert found.role == Role.VIEWER
 
-    def test_get_by_id(self, db, sample_user):
-        db.create_user(sample_user)
-        found = db.get_by_id(sample_user.id)
+    def test_get_by_id(self, user_db, sample_user):
+        user_db.create_user(sample_user)
+        found = user_db.get_by_id(sample_user.id)
         assert found is not None
         assert found.id == sample_user.id
 
-    def test_get_by_email(self, db, sample_user):
-        db.create_user(sample_user)
-        found = db.get_by_email("test@example.com")
+    def test_get_by_email(self, user_db, sample_user):
+        user_db.create_user(sample_user)
+        found = user_db.get_by_email("test@example.com")
         assert found is not None
         assert found.email == "test@example.com"
 
-    def test_user_not_found_returns_none(self, db):
-        assert db.get_by_username("nonexistent") is None
-        assert db.get_by_id("nonexistent") is None
-        assert db.get_by_email("no@where.com") is None
+    def test_user_not_found_returns_none(self, user_db):
+        assert user_db.get_by_username("nonexistent") is None
+        assert user_db.get_by_id("nonexistent") is None
+        assert user_db.get_by_email("no@where.com") is None
 
-    def test_duplicate_username_raises(self, db, sample_user):
-        db.create_user(sample_user)
+    def test_duplicate_username_raises(self, user_db, sample_user):
+        user_db.create_user(sample_user)
         dupe = User(
             username="testuser",
             email="other@example.com",
@@ -205,10 +242,10 @@ class TestUserDatabase:
             role=Role.VIEWER,
         )
         with pytest.raises(ValueError, match="already exists"):
-            db.create_user(dupe)
+            user_db.create_user(dupe)
 
-    def test_duplicate_email_raises(self, db, sample_user):
-        db.create_user(sample_user)
+    def test_duplicate_email_raises(self, user_db, sample_user):
+        user_db.create_user(sample_user)
         dupe = User(
             username="otheruser",
             email="test@example.com",
@@ -216,52 +253,78 @@ class TestUserDatabase:
             role=Role.VIEWER,
         )
         with pytest.raises(ValueError, match="already exists"):
-            db.create_user(dupe)
+            user_db.create_user(dupe)
 
-    def test_update_user(self, db, sample_user):
-        db.create_user(sample_user)
+    def test_update_user(self, user_db, sample_user):
+        user_db.create_user(sample_user)
         sample_user.role = Role.ADMIN
-        assert db.update_user(sample_user) is True
+        assert user_db.update_user(sample_user) is True
 
-        updated = db.get_by_id(sample_user.id)
+        updated = user_db.get_by_id(sample_user.id)
         assert updated is not None
         assert updated.role == Role.ADMIN
 
-    def test_update_nonexistent_user(self, db):
+    def test_update_nonexistent_user(self, user_db):
         ghost = User(id="nonexistent", username="ghost", email="g@g.com", hashed_password="x")
-        assert db.update_user(ghost) is False
+        assert user_db.update_user(ghost) is False
 
-    def test_delete_user(self, db, sample_user):
-        db.create_user(sample_user)
-        assert db.delete_user(sample_user.id) is True
-        assert db.get_by_id(sample_user.id) is None
+    def test_delete_user(self, user_db, sample_user):
+        user_db.create_user(sample_user)
+        assert user_db.delete_user(sample_user.id) is True
+        assert user_db.get_by_id(sample_user.id) is None
 
-    def test_delete_nonexistent_user(self, db):
-        assert db.delete_user("nonexistent") is False
+    def test_delete_nonexistent_user(self, user_db):
+        assert user_db.delete_user("nonexistent") is False
 
-    def test_list_users(self, db, hasher):
-        for i in range(3):
-            db.create_user(User(
+    def test_list_users(self, user_db, hasher):
+        pw_hash = hasher.hash("password")
+        user_db.bulk_create_users([
+            User(
                 username=f"user{i}",
                 email=f"user{i}@test.com",
-                hashed_password=hasher.hash("password"),
-            ))
-        users = db.list_users()
+                hashed_password=pw_hash,
+            )
+            for i in range(3)
+        ])
+        users = user_db.list_users()
         assert len(users) == 3
 
-    def test_list_active_only(self, db, hasher):
+    def test_bulk_create_is_atomic(self, user_db, sample_user):
+        user_db.create_user(sample_user)
+        batch = [
+            User(username="fresh", email="fresh@test.com", hashed_password="h"),
+            User(username="testuser", email="dupe@test.com", hashed_password="h"),
+        ]
+        with pytest.raises(ValueError, match="already exists"):
+            user_db.bulk_create_users(batch)
+        assert user_db.get_by_username("fresh") is None
+        assert user_db.count_users() == 1
+
+    def test_list_active_only(self, user_db, hasher):
         active = User(username="active", email="a@t.com", hashed_password="h", is_active=True)
         inactive = User(username="inactive", email="i@t.com", hashed_password="h", is_active=False)
-        db.create_user(active)
-        db.create_user(inactive)
+        user_db.create_user(active)
+        user_db.create_user(inactive)
+
+        assert len(user_db.list_users(active_only=True)) == 1
+        assert len(user_db.list_users(active_only=False)) == 2
+
+    def test_count_users(self, user_db, sample_user):
+        assert user_db.count_users() == 0
+        user_db.create_user(sample_user)
+        assert user_db.count_users() == 1
 
-        assert len(db.list_users(active_only=True)) == 1
-        assert len(db.list_users(active_only=False)) == 2
+    def test_memory_db_relaxes_pragmas(self, user_db):
+        assert user_db._conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+        assert user_db._conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        assert user_db._conn.execute("PRAGMA locking_mode").fetchone()[0] == "exclusive"
 
-    def test_count_users(self, db, sample_user):
-        assert db.count_users() == 0
-        db.create_user(sample_user)
-        assert db.count_users() == 1
+    def test_clear_removes_all_users(self, user_db, sample_user):
+        user_db.create_user(sample_user)
+        user_db.clear()
+        assert user_db.count_users() == 0
+        user_db.create_user(sample_user)
+        assert user_db.get_by_id(sample_user.id) is not None
 
 
 # ---------------------------------------------------------------------------
@@ -358,14 +421,14 @@ class TestUserModel:
 class TestAuthFlow:
     """End-to-end auth flow without HTTP (direct function calls)."""
 
-    def test_register_login_flow(self, db, hasher, token_service):
+    def test_register_login_flow(self, user_db, hasher, token_service):
         # Register
         hashed = hasher.hash("MyPassword123")
         user = User(username="flowuser", email="flow@test.com", hashed_password=hashed)
-        db.create_user(user)
+        user_db.create_user(user)
 
         # Login - verify password
-        found = db.get_by_username("flowuser")
+        found = user_db.get_by_username("flowuser")
         assert found is not None
         assert hasher.verify("MyPassword123", found.hashed_password)
 
@@ -375,10 +438,10 @@ class TestAuthFlow:
         assert payload["sub"] == found.id
         assert payload["role"] == "viewer"
 
-    def test_refresh_and_revoke_flow(self, db, hasher, token_service):
+    def test_refresh_and_revoke_flow(self, user_db, hasher, token_service):
         hashed = hasher.hash("Password123")
         user = User(username="refreshuser", email="r@test.com", hashed_password=hashed)
-        db.create_user(user)
+        user_db.create_user(user)
 
         # Create initial tokens
         pair = token_service.create_token_pair(user.id, user.role.value)
@@ -395,17 +458,17 @@ class TestAuthFlow:
         with pytest.raises(TokenError, match="revoked"):
             token_service.decode_token(refresh, expected_type="refresh")
 
-    def test_first_user_gets_admin_check(self, db):
+    def test_first_user_gets_admin_check(self, user_db):
         """Verify the DB starts empty (first user logic is in routes)."""
-        assert db.count_users() == 0
+        assert user_db.count_users() == 0
 
-    def test_inactive_user_cannot_be_found_active(self, db, hasher):
+    def test_inactive_user_cannot_be_found_active(self, user_db, hasher):
         user = User(
             username="inactive",
             email="in@test.com",
             hashed_password=hasher.hash("pass1234"),
             is_active=False,
         )
-        db.create_user(user)
-        active_users = db.list_users(active_only=True)
+        user_db.create_user(user)
+        active_users = user_db.list_users(active_only=True)
         assert len(active_users) == 0
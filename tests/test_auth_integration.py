@@ -11,17 +11,13 @@ Tests the full auth lifecycle through FastAPI's test client:
 - Token expiration edge cases
 """
 
-import time
+from collections.abc import Callable
+from datetime import timedelta
 
 import pytest
-from httpx import ASGITransport, AsyncClient
-from fastapi import FastAPI
+from httpx import AsyncClient
 
-from orchestrator.auth.config import AuthConfig
-from orchestrator.auth.database import UserDatabase
-from orchestrator.auth.error_handlers import register_error_handlers
-from orchestrator.auth.routes import create_auth_router
-from orchestrator.auth.tokens import TokenService
+from orchestrator.auth.models import Role, User
 
 
 # ---------------------------------------------------------------------------
@@ -29,88 +25,85 @@ from orchestrator.auth.tokens import TokenService
 # ---------------------------------------------------------------------------
 
 
-def _create_test_app(
-    *,
-    access_token_expire_minutes: int = 30,
-    refresh_token_expire_days: int = 7,
-) -> tuple[FastAPI, AuthConfig, UserDatabase, TokenService]:
-    """Create a fresh FastAPI app with in-memory auth for each test."""
-    config = AuthConfig(
-        secret_key="integration-test-secret-key-fixed",
-        access_token_expire_minutes=access_token_expire_minutes,
-        refresh_token_expire_days=refresh_token_expire_days,
-        db_path=":memory:",
-        min_password_length=8,
-    )
-    db = UserDatabase(":memory:")
-    token_service = TokenService(config)
-    app = FastAPI()
-    register_error_handlers(app)
-    router = create_auth_router(config=config, db=db, token_service=token_service)
-    app.include_router(router)
-    return app, config, db, token_service
-
-
 @pytest.fixture
-async def auth_client():
-    """Async HTTP client with a fresh auth app."""
-    app, config, db, token_service = _create_test_app()
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        yield client
+def auth_client(auth_routes_client: AsyncClient) -> AsyncClient:
+    """Session-wide async HTTP client over an auth app reset for this test."""
+    return auth_routes_client
 
 
 @pytest.fixture
-async def auth_env():
+def auth_env(auth_routes_reset: dict) -> dict:
     """Full test environment: client + db + token_service for deeper checks."""
-    app, config, db, token_service = _create_test_app()
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        yield {
-            "client": client,
-            "config": config,
-            "db": db,
-            "token_service": token_service,
-        }
-
-
-async def _register_user(
-    client: AsyncClient,
-    username: str = "testuser",
-    email: str = "test@example.com",
-    password: str = "SecurePass123",
-) -> dict:
-    """Helper: register a user and return the response JSON."""
-    resp = await client.post("/auth/register", json={
-        "username": username,
-        "email": email,
-        "password": password,
-    })
+    return {
+        "client": auth_routes_reset["client"],
+        "config": auth_routes_reset["config"],
+        "db": auth_routes_reset["db"],
+        "token_service": auth_routes_reset["token_service"],
+    }
+
+
+_DEFAULT_REG = {
+    "username": "testuser",
+    "email": "test@example.com",
+    "password": "SecurePass123",
+}
+_DEFAULT_LOGIN = {
+    "username": _DEFAULT_REG["username"],
+    "password": _DEFAULT_REG["password"],
+}
+
+
+async def _register_user(client: AsyncClient, **overrides: str) -> dict:
+    """Helper: register a user and return the response JSON.
+
+    Keyword arguments override fields of ``_DEFAULT_REG``.
+    """
+    resp = await client.post("/auth/register", json=_DEFAULT_REG | overrides)
     return resp.json()
 
 
-async def _login_user(
-    client: AsyncClient,
-    username: str = "testuser",
-    password: str = "SecurePass123",
-) -> dict:
-    """Helper: login and return the response JSON (includes tokens)."""
-    resp = await client.post("/auth/login", json={
-        "username": username,
-        "password": password,
-    })
+async def _login_user(client: AsyncClient, **overrides: str) -> dict:
+    """Helper: login and return the response JSON (includes tokens).
+
+    Keyword arguments override fields of ``_DEFAULT_LOGIN``.
+    """
+    resp = await client.post("/auth/login", json=_DEFAULT_LOGIN | overrides)
     return resp.json()
 
 
-async def _register_and_login(
-    client: AsyncClient,
-    username: str = "testuser",
-    email: str = "test@example.com",
-    password: str = "SecurePass123",
-) -> dict:
+async def _register_and_login(client: AsyncClient, **overrides: str) -> dict:
     """Helper: register then login, return token response."""
-    await _register_user(client, username, email, password)
-    return await _login_user(client, username, password)
+    await _register_user(client, **overrides)
+    login_overrides = {k: v for k, v in overrides.items() if k in _DEFAULT_LOGIN}
+    return await _login_user(client, **login_overrides)
+
+
+@pytest.fixture
+def testuser(auth_routes_reset: dict) -> User:
+    """The default ``testuser``, created straight in the DB without HTTP.
+
+    For tests that need an existing account but don't exercise the
+    register endpoint themselves.
+    """
+    user = User(
+        username=_DEFAULT_REG["username"],
+        email=_DEFAULT_REG["email"],
+        hashed_password=auth_routes_reset["hasher"].hash(_DEFAULT_REG["password"]),
+    )
+    auth_routes_reset["db"].create_user(user)
+    return user
+
+
+@pytest.fixture
+def testuser_tokens(auth_routes_reset: dict, testuser: User) -> dict:
+    """Token pair for the default ``testuser``, minted without HTTP.
+
+    Signs tokens with the app's TokenService, for tests that need a
+    logged-in user but don't exercise the login endpoint themselves.
+    """
+    return auth_routes_reset["token_service"].create_token_pair(
+        testuser.id, testuser.role.value,
+    )
 
 
 def _auth_header(access_token: str) -> dict[str, str]:
@@ -127,10 +120,9 @@ class TestRegistration:
     """POST /auth/register"""
 
     async def test_successful_registration(self, auth_client: AsyncClient) -> None:
-        resp = await auth_client.post("/auth/register", json={
+        resp = await auth_client.post("/auth/register", json=_DEFAULT_REG | {
             "username": "newuser",
             "email": "new@example.com",
-            "password": "SecurePass123",
         })
         assert resp.status_code == 201
         data = resp.json()
@@ -143,57 +135,51 @@ class TestRegistration:
         assert "hashed_password" not in data
 
     async def test_first_user_gets_admin_role(self, auth_client: AsyncClient) -> None:
-        resp = await auth_client.post("/auth/register", json={
+        resp = await auth_client.post("/auth/register", json=_DEFAULT_REG | {
             "username": "firstuser",
             "email": "first@example.com",
-            "password": "SecurePass123",
         })
         assert resp.status_code == 201
         assert resp.json()["role"] == "admin"
 
     async def test_second_user_gets_viewer_role(self, auth_client: AsyncClient) -> None:
-        await _register_user(auth_client, "first", "first@example.com")
-        resp = await auth_client.post("/auth/register", json={
+        await _register_user(auth_client, username="first", email="first@example.com")
+        resp = await auth_client.post("/auth/register", json=_DEFAULT_REG | {
             "username": "second",
             "email": "second@example.com",
-            "password": "SecurePass123",
         })
         assert resp.status_code == 201
         assert resp.json()["role"] == "viewer"
 
     async def test_duplicate_username_rejected(self, auth_client: AsyncClient) -> None:
-        await _register_user(auth_client, "taken", "a@example.com")
-        resp = await auth_client.post("/auth/register", json={
+        await _register_user(auth_client, username="taken", email="a@example.com")
+        resp = await auth_client.post("/auth/register", json=_DEFAULT_REG | {
             "username": "taken",
             "email": "b@example.com",
-            "password": "SecurePass123",
         })
         assert resp.status_code == 409
         assert "already exists" in resp.json()["error"]["message"]
 
     async def test_duplicate_email_rejected(self, auth_client: AsyncClient) -> None:
-        await _register_user(auth_client, "user1", "same@example.com")
-        resp = await auth_client.post("/auth/register", json={
+        await _register_user(auth_client, username="user1", email="same@example.com")
+        resp = await auth_client.post("/auth/register", json=_DEFAULT_REG | {
             "username": "user2",
             "email": "same@example.com",
-            "password": "SecurePass123",
         })
         assert resp.status_code == 409
         assert "already exists" in resp.json()["error"]["message"]
 
     async def test_username_too_short_rejected(self, auth_client: AsyncClient) -> None:
-        resp = await auth_client.post("/auth/register", json={
+        resp = await auth_client.post("/auth/register", json=_DEFAULT_REG | {
             "username": "ab",
             "email": "ab@example.com",
-            "password": "SecurePass123",
         })
         assert resp.status_code == 422
 
     async def test_invalid_email_rejected(self, auth_client: AsyncClient) -> None:
-        resp = await auth_client.post("/auth/register", json={
+        resp = await auth_client.post("/auth/register", json=_DEFAULT_REG | {
             "username": "validuser",
             "email": "not-an-email",
-            "password": "SecurePass123",
         })
         assert resp.status_code == 422
 
@@ -207,19 +193,17 @@ class TestRegistration:
         assert resp.status_code == 422
 
     async def test_username_normalized_to_lowercase(self, auth_client: AsyncClient) -> None:
-        resp = await auth_client.post("/auth/register", json={
+        resp = await auth_client.post("/auth/register", json=_DEFAULT_REG | {
             "username": "MyUser",
             "email": "my@example.com",
-            "password": "SecurePass123",
         })
         assert resp.status_code == 201
         assert resp.json()["username"] == "myuser"
 
     async def test_special_chars_in_username_rejected(self, auth_client: AsyncClient) -> None:
-        resp = await auth_client.post("/auth/register", json={
+        resp = await auth_client.post("/auth/register", json=_DEFAULT_REG | {
             "username": "user name",
             "email": "u@example.com",
-            "password": "SecurePass123",
         })
         assert resp.status_code == 422
 
@@ -240,12 +224,9 @@ class TestRegistration:
 class TestLogin:
     """POST /auth/login"""
 
+    @pytest.mark.usefixtures("testuser")
     async def test_successful_login(self, auth_client: AsyncClient) -> None:
-        await _register_user(auth_client)
-        resp = await auth_client.post("/auth/login", json={
-            "username": "testuser",
-            "password": "SecurePass123",
-        })
+        resp = await auth_client.post("/auth/login", json=_DEFAULT_LOGIN)
         assert resp.status_code == 200
         data = resp.json()
         assert "access_token" in data
@@ -253,8 +234,8 @@ class TestLogin:
         assert data["token_type"] == "bearer"
         assert data["expires_in"] > 0
 
+    @pytest.mark.usefixtures("testuser")
     async def test_wrong_password_rejected(self, auth_client: AsyncClient) -> None:
-        await _register_user(auth_client)
         resp = await auth_client.post("/auth/login", json={
             "username": "testuser",
             "password": "WrongPassword123",
@@ -274,7 +255,7 @@ class TestLogin:
         client = auth_env["client"]
         db = auth_env["db"]
 
-        await _register_user(client, "deactivated", "d@example.com")
+        await _register_user(client, username="deactivated", email="d@example.com")
         user = db.get_by_username("deactivated")
         user.is_active = False
         db.update_user(user)
@@ -286,21 +267,21 @@ class TestLogin:
         assert resp.status_code == 403
         assert "deactivated" in resp.json()["error"]["message"].lower()
 
+    @pytest.mark.usefixtures("testuser")
     async def test_login_returns_valid_access_token(self, auth_env: dict) -> None:
         """Access token from login should work on protected endpoints."""
         client = auth_env["client"]
-        tokens = await _register_and_login(client)
+        tokens = await _login_user(client)
 
         resp = await client.get("/auth/me", headers=_auth_header(tokens["access_token"]))
         assert resp.status_code == 200
         assert resp.json()["username"] == "testuser"
 
+    @pytest.mark.usefixtures("testuser")
     async def test_error_message_doesnt_leak_which_field_failed(
         self, auth_client: AsyncClient,
     ) -> None:
         """Login error should not reveal whether username or password was wrong."""
-        await _register_user(auth_client)
-
         # Wrong username
         r1 = await auth_client.post("/auth/login", json={
             "username": "wronguser",
@@ -323,10 +304,11 @@ class TestLogin:
 class TestTokenRefresh:
     """POST /auth/refresh"""
 
-    async def test_successful_refresh(self, auth_client: AsyncClient) -> None:
-        tokens = await _register_and_login(auth_client)
+    async def test_successful_refresh(
+        self, auth_client: AsyncClient, testuser_tokens: dict,
+    ) -> None:
         resp = await auth_client.post("/auth/refresh", json={
-            "refresh_token": tokens["refresh_token"],
+            "refresh_token": testuser_tokens["refresh_token"],
         })
         assert resp.status_code == 200
         data = resp.json()
@@ -336,11 +318,10 @@ class TestTokenRefresh:
         assert data["expires_in"] > 0
 
     async def test_old_refresh_token_revoked_after_rotation(
-        self, auth_client: AsyncClient,
+        self, auth_client: AsyncClient, testuser_tokens: dict,
     ) -> None:
         """After refresh, the old refresh token should be revoked."""
-        tokens = await _register_and_login(auth_client)
-        old_refresh = tokens["refresh_token"]
+        old_refresh = testuser_tokens["refresh_token"]
 
         # Use the refresh token
         resp = await auth_client.post("/auth/refresh", json={
@@ -356,30 +337,21 @@ class TestTokenRefresh:
         assert "revoked" in resp2.json()["error"]["message"].lower()
 
     async def test_access_token_rejected_as_refresh(
-        self, auth_client: AsyncClient,
+        self, auth_client: AsyncClient, testuser_tokens: dict,
     ) -> None:
-        tokens = await _register_and_login(auth_client)
+        """Decode failures surface as 401s; the cases themselves live in test_auth."""
         resp = await auth_client.post("/auth/refresh", json={
-            "refresh_token": tokens["access_token"],
+            "refresh_token": testuser_tokens["access_token"],
         })
         assert resp.status_code == 401
         assert "Expected refresh token" in resp.json()["error"]["message"]
 
-    async def test_invalid_refresh_token_rejected(
-        self, auth_client: AsyncClient,
-    ) -> None:
-        resp = await auth_client.post("/auth/refresh", json={
-            "refresh_token": "not.a.valid.jwt",
-        })
-        assert resp.status_code == 401
-
     async def test_refresh_returns_working_tokens(
-        self, auth_client: AsyncClient,
+        self, auth_client: AsyncClient, testuser_tokens: dict,
     ) -> None:
         """New tokens from refresh should work on protected endpoints."""
-        tokens = await _register_and_login(auth_client)
         resp = await auth_client.post("/auth/refresh", json={
-            "refresh_token": tokens["refresh_token"],
+            "refresh_token": testuser_tokens["refresh_token"],
         })
         new_tokens = resp.json()
 
@@ -391,19 +363,19 @@ class TestTokenRefresh:
         assert me_resp.status_code == 200
         assert me_resp.json()["username"] == "testuser"
 
-    async def test_refresh_for_deactivated_user_rejected(self, auth_env: dict) -> None:
+    async def test_refresh_for_deactivated_user_rejected(
+        self, auth_env: dict, testuser_tokens: dict,
+    ) -> None:
         client = auth_env["client"]
         db = auth_env["db"]
 
-        tokens = await _register_and_login(client)
-
         # Deactivate the user after they got tokens
         user = db.get_by_username("testuser")
         user.is_active = False
         db.update_user(user)
 
         resp = await client.post("/auth/refresh", json={
-            "refresh_token": tokens["refresh_token"],
+            "refresh_token": testuser_tokens["refresh_token"],
         })
         assert resp.status_code == 401
         assert "deactivated" in resp.json()["error"]["message"].lower() or \
@@ -418,11 +390,12 @@ class TestTokenRefresh:
 class TestProtectedEndpoints:
     """GET /auth/me and GET /auth/users"""
 
-    async def test_me_with_valid_token(self, auth_client: AsyncClient) -> None:
-        tokens = await _register_and_login(auth_client)
+    async def test_me_with_valid_token(
+        self, auth_client: AsyncClient, testuser_tokens: dict,
+    ) -> None:
         resp = await auth_client.get(
             "/auth/me",
-            headers=_auth_header(tokens["access_token"]),
+            headers=_auth_header(testuser_tokens["access_token"]),
         )
         assert resp.status_code == 200
         data = resp.json()
@@ -430,72 +403,68 @@ class TestProtectedEndpoints:
         assert data["email"] == "test@example.com"
         assert "hashed_password" not in data
 
-    async def test_me_without_token_returns_401(self, auth_client: AsyncClient) -> None:
-        resp = await auth_client.get("/auth/me")
-        assert resp.status_code == 401
-
-    async def test_me_with_invalid_token_returns_401(
-        self, auth_client: AsyncClient,
+    @pytest.mark.parametrize(
+        ("token_key", "raw_token", "expected_msg"),
+        [
+            pytest.param(None, None, "Authentication required", id="no-token"),
+            pytest.param(None, "totally.invalid.token", "Invalid token", id="invalid-token"),
+            # A refresh token where an access token is expected
+            pytest.param("refresh_token", None, "Expected access token", id="refresh-token"),
+        ],
+    )
+    async def test_me_rejects_bad_credentials(
+        self,
+        auth_client: AsyncClient,
+        testuser_tokens: dict,
+        token_key: str | None,
+        raw_token: str | None,
+        expected_msg: str,
     ) -> None:
-        resp = await auth_client.get(
-            "/auth/me",
-            headers=_auth_header("totally.invalid.token"),
-        )
+        # token_key names one of testuser's issued tokens; raw_token is sent as-is
+        token = testuser_tokens[token_key] if token_key is not None else raw_token
+        headers = {} if token is None else _auth_header(token)
+        resp = await auth_client.get("/auth/me", headers=headers)
         assert resp.status_code == 401
+        assert expected_msg in resp.json()["error"]["message"]
 
-    async def test_me_with_tampered_token_returns_401(
-        self, auth_client: AsyncClient,
+    async def test_me_rejects_tampered_token(
+        self, auth_client: AsyncClient, testuser_tokens: dict,
     ) -> None:
-        tokens = await _register_and_login(auth_client)
-        tampered = tokens["access_token"][:-5] + "XXXXX"
-        resp = await auth_client.get(
-            "/auth/me",
-            headers=_auth_header(tampered),
-        )
+        tampered = testuser_tokens["access_token"][:-5] + "XXXXX"
+        resp = await auth_client.get("/auth/me", headers=_auth_header(tampered))
         assert resp.status_code == 401
+        assert "Invalid token" in resp.json()["error"]["message"]
 
-    async def test_me_with_refresh_token_rejected(
-        self, auth_client: AsyncClient,
+    async def test_me_for_deleted_user_returns_401(
+        self, auth_env: dict, testuser_tokens: dict,
     ) -> None:
-        """Using a refresh token where an access token is expected should fail."""
-        tokens = await _register_and_login(auth_client)
-        resp = await auth_client.get(
-            "/auth/me",
-            headers=_auth_header(tokens["refresh_token"]),
-        )
-        assert resp.status_code == 401
-        assert "Expected access token" in resp.json()["error"]["message"]
-
-    async def test_me_for_deleted_user_returns_401(self, auth_env: dict) -> None:
         client = auth_env["client"]
         db = auth_env["db"]
 
-        tokens = await _register_and_login(client)
-
         # Delete the user from DB after login
         user = db.get_by_username("testuser")
         db.delete_user(user.id)
 
         resp = await client.get(
             "/auth/me",
-            headers=_auth_header(tokens["access_token"]),
+            headers=_auth_header(testuser_tokens["access_token"]),
         )
         assert resp.status_code == 401
         assert "not found" in resp.json()["error"]["message"].lower()
 
-    async def test_me_for_deactivated_user_returns_403(self, auth_env: dict) -> None:
+    async def test_me_for_deactivated_user_returns_403(
+        self, auth_env: dict, testuser_tokens: dict,
+    ) -> None:
         client = auth_env["client"]
         db = auth_env["db"]
 
-        tokens = await _register_and_login(client)
-
         user = db.get_by_username("testuser")
         user.is_active = False
         db.update_user(user)
 
         resp = await client.get(
             "/auth/me",
-            headers=_auth_header(tokens["access_token"]),
+            headers=_auth_header(testuser_tokens["access_token"]),
         )
         assert resp.status_code == 403
         assert "deactivated" in resp.json()["error"]["message"].lower()
@@ -509,12 +478,28 @@ class TestProtectedEndpoints:
 class TestAdminEndpoints:
     """GET /auth/users (requires admin role)"""
 
-    async def test_admin_can_list_users(self, auth_client: AsyncClient) -> None:
-        # First user is auto-admin
-        tokens = await _register_and_login(auth_client, "admin", "admin@ex.com")
+    @pytest.fixture
+    def admin_tokens(self, auth_routes_reset: dict) -> dict:
+        """Token pair for an admin seeded straight into the DB.
+
+        First-user promotion is covered by TestRegistration, so these tests
+        skip the register/login round trip for the admin.
+        """
+        admin = User(
+            username="admin",
+            email="admin@ex.com",
+            hashed_password=auth_routes_reset["hasher"].hash(_DEFAULT_REG["password"]),
+            role=Role.ADMIN,
+        )
+        auth_routes_reset["db"].create_user(admin)
+        return auth_routes_reset["token_service"].create_token_pair(admin.id, admin.role.value)
+
+    async def test_admin_can_list_users(
+        self, auth_client: AsyncClient, admin_tokens: dict,
+    ) -> None:
         resp = await auth_client.get(
             "/auth/users",
-            headers=_auth_header(tokens["access_token"]),
+            headers=_auth_header(admin_tokens["access_token"]),
         )
         assert resp.status_code == 200
         data = resp.json()
@@ -522,10 +507,10 @@ class TestAdminEndpoints:
         assert len(data) == 1
         assert data[0]["username"] == "admin"
 
+    @pytest.mark.usefixtures("admin_tokens")
     async def test_viewer_cannot_list_users(self, auth_client: AsyncClient) -> None:
-        # First user = admin, second = viewer
-        await _register_user(auth_client, "admin", "admin@ex.com")
-        tokens = await _register_and_login(auth_client, "viewer", "viewer@ex.com")
+        # An admin already exists, so this registration gets the viewer role
+        tokens = await _register_and_login(auth_client, username="viewer", email="viewer@ex.com")
 
         resp = await auth_client.get(
             "/auth/users",
@@ -540,12 +525,15 @@ class TestAdminEndpoints:
         resp = await auth_client.get("/auth/users")
         assert resp.status_code == 401
 
-    async def test_admin_sees_all_users(self, auth_client: AsyncClient) -> None:
-        admin_tokens = await _register_and_login(auth_client, "admin", "admin@ex.com")
-        await _register_user(auth_client, "user2", "u2@ex.com")
-        await _register_user(auth_client, "user3", "u3@ex.com")
+    async def test_admin_sees_all_users(
+        self, auth_env: dict, admin_tokens: dict,
+    ) -> None:
+        auth_env["db"].bulk_create_users([
+            User(username="user2", email="u2@ex.com", hashed_password="unused"),
+            User(username="user3", email="u3@ex.com", hashed_password="unused"),
+        ])
 
-        resp = await auth_client.get(
+        resp = await auth_env["client"].get(
             "/auth/users",
             headers=_auth_header(admin_tokens["access_token"]),
         )
@@ -561,58 +549,54 @@ class TestAdminEndpoints:
 class TestLogout:
     """POST /auth/logout"""
 
-    async def test_successful_logout(self, auth_client: AsyncClient) -> None:
-        tokens = await _register_and_login(auth_client)
+    async def test_successful_logout(self, auth_client: AsyncClient, testuser_tokens: dict) -> None:
         resp = await auth_client.post(
             "/auth/logout",
-            json={"refresh_token": tokens["refresh_token"]},
-            headers=_auth_header(tokens["access_token"]),
+            json={"refresh_token": testuser_tokens["refresh_token"]},
+            headers=_auth_header(testuser_tokens["access_token"]),
         )
         assert resp.status_code == 200
         assert "logged out" in resp.json()["message"].lower()
 
     async def test_refresh_token_invalidated_after_logout(
-        self, auth_client: AsyncClient,
+        self, auth_client: AsyncClient, testuser_tokens: dict,
     ) -> None:
-        tokens = await _register_and_login(auth_client)
         # Logout
         await auth_client.post(
             "/auth/logout",
-            json={"refresh_token": tokens["refresh_token"]},
-            headers=_auth_header(tokens["access_token"]),
+            json={"refresh_token": testuser_tokens["refresh_token"]},
+            headers=_auth_header(testuser_tokens["access_token"]),
         )
         # Try to refresh with the now-revoked token
         resp = await auth_client.post("/auth/refresh", json={
-            "refresh_token": tokens["refresh_token"],
+            "refresh_token": testuser_tokens["refresh_token"],
         })
         assert resp.status_code == 401
         assert "revoked" in resp.json()["error"]["message"].lower()
 
     async def test_logout_requires_access_token(
-        self, auth_client: AsyncClient,
+        self, auth_client: AsyncClient, testuser_tokens: dict,
     ) -> None:
-        tokens = await _register_and_login(auth_client)
         resp = await auth_client.post(
             "/auth/logout",
-            json={"refresh_token": tokens["refresh_token"]},
+            json={"refresh_token": testuser_tokens["refresh_token"]},
             # No Authorization header
         )
         assert resp.status_code == 401
 
     async def test_access_token_still_works_after_logout(
-        self, auth_client: AsyncClient,
+        self, auth_client: AsyncClient, testuser_tokens: dict,
     ) -> None:
         """Access tokens aren't revoked on logout - they expire naturally."""
-        tokens = await _register_and_login(auth_client)
         await auth_client.post(
             "/auth/logout",
-            json={"refresh_token": tokens["refresh_token"]},
-            headers=_auth_header(tokens["access_token"]),
+            json={"refresh_token": testuser_tokens["refresh_token"]},
+            headers=_auth_header(testuser_tokens["access_token"]),
         )
         # Access token should still be valid (not blacklisted)
         resp = await auth_client.get(
             "/auth/me",
-            headers=_auth_header(tokens["access_token"]),
+            headers=_auth_header(testuser_tokens["access_token"]),
         )
         assert resp.status_code == 200
 
@@ -625,40 +609,52 @@ class TestLogout:
 class TestTokenExpiration:
     """Edge cases around token lifetimes."""
 
-    async def test_expired_access_token_rejected(self) -> None:
-        """An immediately-expiring token should fail after a brief wait."""
-        app, config, db, token_service = _create_test_app(
-            access_token_expire_minutes=0,
-        )
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            await _register_user(client)
-            tokens = await _login_user(client)
-            time.sleep(0.2)
-
-            resp = await client.get(
-                "/auth/me",
-                headers=_auth_header(tokens["access_token"]),
-            )
-            assert resp.status_code == 401
-            assert "expired" in resp.json()["error"]["message"].lower()
-
-    async def test_expired_refresh_token_rejected(self) -> None:
-        """An immediately-expiring refresh token should fail."""
-        app, config, db, token_service = _create_test_app(
-            refresh_token_expire_days=0,
+    @pytest.fixture
+    def advance_clock(
+        self, auth_env: dict, monkeypatch: pytest.MonkeyPatch,
+    ) -> Callable[[timedelta], None]:
+        """Freeze the app's token clock and return a function that moves it forward."""
+        token_service = auth_env["token_service"]
+        now = [token_service.clock()]
+        monkeypatch.setattr(token_service, "clock", lambda: now[0])
+
+        def advance(delta: timedelta) -> None:
+            now[0] += delta
+
+        return advance
+
+    async def test_expired_access_token_rejected(
+        self,
+        auth_env: dict,
+        testuser_tokens: dict,
+        advance_clock: Callable[[timedelta], None],
+    ) -> None:
+        """An access token should fail once the clock passes its lifetime."""
+        lifetime = timedelta(minutes=auth_env["config"].access_token_expire_minutes)
+        advance_clock(lifetime + timedelta(seconds=1))
+
+        resp = await auth_env["client"].get(
+            "/auth/me",
+            headers=_auth_header(testuser_tokens["access_token"]),
         )
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            await _register_user(client)
-            tokens = await _login_user(client)
-            time.sleep(0.2)
+        assert resp.status_code == 401
+        assert "expired" in resp.json()["error"]["message"].lower()
+
+    async def test_expired_refresh_token_rejected(
+        self,
+        auth_env: dict,
+        testuser_tokens: dict,
+        advance_clock: Callable[[timedelta], None],
+    ) -> None:
+        """A refresh token should fail once the clock passes its lifetime."""
+        lifetime = timedelta(days=auth_env["config"].refresh_token_expire_days)
+        advance_clock(lifetime + timedelta(seconds=1))
 
-            resp = await client.post("/auth/refresh", json={
-                "refresh_token": tokens["refresh_token"],
-            })
-            assert resp.status_code == 401
-            assert "expired" in resp.json()["error"]["message"].lower()
+        resp = await auth_env["client"].post("/auth/refresh", json={
+            "refresh_token": testuser_tokens["refresh_token"],
+        })
+        assert resp.status_code == 401
+        assert "expired" in resp.json()["error"]["message"].lower()
 
 
 # ===========================================================================
@@ -674,10 +670,9 @@ class TestFullAuthLifecycle:
     ) -> None:
         """Complete lifecycle: register -> login -> use -> refresh -> logout."""
         # 1. Register
-        reg_resp = await auth_client.post("/auth/register", json={
+        reg_resp = await auth_client.post("/auth/register", json=_DEFAULT_REG | {
             "username": "lifecycle",
             "email": "life@example.com",
-            "password": "SecurePass123",
         })
         assert reg_resp.status_code == 201
 
@@ -733,8 +728,8 @@ class TestFullAuthLifecycle:
 
     async def test_multiple_users_isolated(self, auth_client: AsyncClient) -> None:
         """Tokens from one user should not access another's data."""
-        tokens_a = await _register_and_login(auth_client, "alice", "alice@ex.com")
-        tokens_b = await _register_and_login(auth_client, "bob", "bob@ex.com")
+        tokens_a = await _register_and_login(auth_client, username="alice", email="alice@ex.com")
+        tokens_b = await _register_and_login(auth_client, username="bob", email="bob@ex.com")
 
         # Alice's token returns Alice
         resp_a = await auth_client.get(
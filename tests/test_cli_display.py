@@ -14,6 +14,8 @@ The cli_display module provides:
 No I/O needed - pure computation tests.
 """
 
+import dataclasses
+
 import pytest
 
 from orchestrator.cli_display import (
@@ -43,18 +45,18 @@ class TestColors:
 
     def test_all_standard_colors_exist(self) -> None:
         """All standard color attributes should exist."""
-        for name in ["RED", "GREEN", "BLUE", "YELLOW", "CYAN", "MAGENTA", "WHITE", "BLACK"]:
-            assert hasattr(Colors, name), f"Colors.{name} should exist"
+        expected = {"RED", "GREEN", "BLUE", "YELLOW", "CYAN", "MAGENTA", "WHITE", "BLACK"}
+        assert not expected - set(dir(Colors)), "missing standard colors"
 
     def test_all_bright_colors_exist(self) -> None:
         """All bright color attributes should exist."""
-        for name in ["BRIGHT_RED", "BRIGHT_GREEN", "BRIGHT_BLUE", "BRIGHT_CYAN"]:
-            assert hasattr(Colors, name)
+        expected = {"BRIGHT_RED", "BRIGHT_GREEN", "BRIGHT_BLUE", "BRIGHT_CYAN"}
+        assert not expected - set(dir(Colors)), "missing bright colors"
 
     def test_styles_exist(self) -> None:
         """Style attributes should exist."""
-        for name in ["BOLD", "DIM", "ITALIC", "UNDERLINE"]:
-            assert hasattr(Colors, name)
+        expected = {"BOLD", "DIM", "ITALIC", "UNDERLINE"}
+        assert not expected - set(dir(Colors)), "missing styles"
 
 
 class TestColorFunction:
@@ -94,6 +96,13 @@ class TestTerminalPersonalities:
             assert personality.color is not None
             assert personality.description != ""
 
+    def test_personalities_are_immutable(self) -> None:
+        """The shared personality table should not be editable through an entry."""
+        personality = TERMINAL_PERSONALITIES["t1"]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            personality.name = "Renamed"  # type: ignore[misc]
+        assert not hasattr(personality, "__dict__")
+
     @pytest.mark.parametrize(
         "tid,expected_name",
         [
@@ -198,40 +207,32 @@ class TestQualityBar:
 class TestQualityLabel:
     """Test quality label descriptions."""
 
-    @pytest.mark.parametrize(
-        "quality,expected_text",
-        [
+    def test_quality_labels(self) -> None:
+        """Each quality band should map to its label."""
+        for quality, expected_text in (
             (0.95, "Excellent"),
             (0.85, "Polished"),
             (0.65, "Solid"),
             (0.45, "Working"),
             (0.25, "Draft"),
             (0.05, "Starting"),
-        ],
-    )
-    def test_quality_labels(self, quality: float, expected_text: str) -> None:
-        """Quality level should map to correct label."""
-        label = strip_ansi(quality_label(quality))
-        assert label == expected_text
+        ):
+            assert strip_ansi(quality_label(quality)) == expected_text, quality
 
 
 class TestFlowStateIndicator:
     """Test flow state visual indicators."""
 
-    @pytest.mark.parametrize(
-        "state,expected",
-        [
+    def test_known_states(self) -> None:
+        """Known flow states should return correct indicators."""
+        for state, expected in (
             ("idle", "~"),
             ("flowing", ">>"),
             ("blocked", "!!"),
             ("syncing", "<>"),
             ("completing", "OK"),
-        ],
-    )
-    def test_known_states(self, state: str, expected: str) -> None:
-        """Known flow states should return correct indicators."""
-        indicator = strip_ansi(flow_state_indicator(state))
-        assert indicator == expected
+        ):
+            assert strip_ansi(flow_state_indicator(state)) == expected, state
 
     def test_unknown_state(self) -> None:
         """Unknown state should return question mark."""
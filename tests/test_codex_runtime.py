@@ -1,13 +1,18 @@
 """Tests for Codex-ready runtime configuration and prompt compaction."""
 
+import os
 from pathlib import Path
 
+import pytest
+
+from orchestrator import config as config_module
 from orchestrator.config import Config
 
 
-def _make_config(tmp_path: Path) -> Config:
-    """Create an isolated config rooted in tmp_path."""
-    return Config(
+@pytest.fixture
+def cfg(tmp_path: Path) -> Config:
+    """An isolated config rooted in tmp_path, with its directories created."""
+    config = Config(
         base_dir=tmp_path,
         orchestra_dir=tmp_path / ".orchestra",
         templates_dir=tmp_path / "templates" / "terminal_prompts",
@@ -15,6 +20,8 @@ def _make_config(tmp_path: Path) -> Config:
         agents_dir=tmp_path / ".claude" / "agents",
         apps_dir=tmp_path / "Apps",
     )
+    config.ensure_dirs()
+    return config
 
 
 def test_post_init_sets_compact_dir_with_custom_templates(tmp_path: Path) -> None:
@@ -25,9 +32,7 @@ def test_post_init_sets_compact_dir_with_custom_templates(tmp_path: Path) -> Non
     assert cfg.compact_templates_dir == tmp_path / "templates" / "terminal_prompts_compact"
 
 
-def test_get_terminal_system_prompt_path_prefers_compact(tmp_path: Path) -> None:
-    cfg = _make_config(tmp_path)
-    cfg.ensure_dirs()
+def test_get_terminal_system_prompt_path_prefers_compact(cfg: Config) -> None:
     prompt_name = cfg.get_terminal_config("t1").prompt_file
     (cfg.templates_dir / prompt_name).write_text("full prompt")
     compact = cfg.compact_templates_dir / prompt_name
@@ -36,9 +41,32 @@ def test_get_terminal_system_prompt_path_prefers_compact(tmp_path: Path) -> None
     assert cfg.get_terminal_system_prompt_path("t1") == compact
 
 
-def test_load_system_prompt_includes_runtime_header(tmp_path: Path) -> None:
-    cfg = _make_config(tmp_path)
-    cfg.ensure_dirs()
+def test_get_terminal_system_prompt_path_sees_new_compact_template(
+    cfg: Config, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config_module, "_MTIME_SETTLE_NS", 0)
+    scan_info = config_module._scan_file_names.cache_info
+    # Backdate the empty directory so adding a file always changes its mtime
+    dir_stat = cfg.compact_templates_dir.stat()
+    os.utime(
+        cfg.compact_templates_dir,
+        ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns - 10_000_000_000),
+    )
+    prompt_name = cfg.get_terminal_config("t1").prompt_file
+    assert cfg.get_terminal_system_prompt_path("t1") == cfg.templates_dir / prompt_name
+    hits_before = scan_info().hits
+    assert cfg.get_terminal_system_prompt_path("t1") == cfg.templates_dir / prompt_name
+    assert scan_info().hits == hits_before + 1
+
+    compact = cfg.compact_templates_dir / prompt_name
+    compact.write_text("compact prompt")
+    misses_before = scan_info().misses
+
+    assert cfg.get_terminal_system_prompt_path("t1") == compact
+    assert scan_info().misses == misses_before + 1
+
+
+def test_load_system_prompt_includes_runtime_header(cfg: Config) -> None:
     cfg.llm_provider = "codex"
     cfg.llm_model = "gpt-5.3-codex"
 
@@ -54,9 +82,7 @@ def test_load_system_prompt_includes_runtime_header(tmp_path: Path) -> None:
     assert "T2 compact prompt body" in loaded
 
 
-def test_load_system_prompt_truncates(tmp_path: Path) -> None:
-    cfg = _make_config(tmp_path)
-    cfg.ensure_dirs()
+def test_load_system_prompt_truncates(cfg: Config) -> None:
     cfg.max_system_prompt_chars = 40
 
     prompt_name = cfg.get_terminal_config("t1").prompt_file
@@ -66,6 +92,28 @@ def test_load_system_prompt_truncates(tmp_path: Path) -> None:
     assert "Prompt truncated to reduce token usage" in loaded
 
 
+def test_load_system_prompt_picks_up_edited_template(
+    cfg: Config, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config_module, "_MTIME_SETTLE_NS", 0)
+    read_info = config_module._read_prompt_template.cache_info
+    prompt_path = cfg.compact_templates_dir / cfg.get_terminal_config("t1").prompt_file
+    prompt_path.write_text("first version")
+    first = cfg.load_system_prompt("t1")
+    hits_before = read_info().hits
+    assert cfg.load_system_prompt("t1") == first
+    assert read_info().hits == hits_before + 1
+
+    # Same clock tick or not, the new size alone changes the cache key
+    prompt_path.write_text("second, longer version")
+    misses_before = read_info().misses
+    second = cfg.load_system_prompt("t1")
+
+    assert first is not None and "first version" in first
+    assert second is not None and "second, longer version" in second
+    assert read_info().misses == misses_before + 1
+
+
 def test_build_llm_command_claude_default() -> None:
     cfg = Config()
     cmd = cfg.build_llm_command("hello world", allow_unsafe=True)
@@ -91,12 +139,54 @@ def test_build_llm_command_codex() -> None:
     assert cmd[-1] == "implement feature"
 
 
-def test_get_all_subagents_merges_local_agent_defs(tmp_path: Path) -> None:
-    cfg = _make_config(tmp_path)
-    cfg.ensure_dirs()
+def test_build_llm_command_codex_safe_argv() -> None:
+    cfg = Config()
+    cfg.llm_provider = "codex"
+    cfg.llm_command = "codex"
+
+    cmd = cfg.build_llm_command("plan", allow_unsafe=False)
+
+    assert cmd == [
+        "codex",
+        "exec",
+        "--color",
+        "never",
+        "-a",
+        "never",
+        "-s",
+        "workspace-write",
+        "-m",
+        cfg.codex_default_model,
+        "plan",
+    ]
+
+
+def test_get_all_subagents_merges_local_agent_defs(cfg: Config) -> None:
     (cfg.agents_dir / "creative-researcher.md").write_text("# Creative Researcher")
 
     subagents = cfg.get_all_subagents()
     assert "creative-researcher" in subagents
     assert "swiftui-crafter" in subagents
     assert "test-genius" in subagents
+
+
+def test_get_all_subagents_sees_new_agent_defs(cfg: Config) -> None:
+    assert "late-agent" not in cfg.get_all_subagents()
+    (cfg.agents_dir / "late-agent.md").write_text("# Late Agent")
+
+    assert "late-agent" in cfg.get_all_subagents()
+
+
+def test_get_all_subagents_caches_settled_agents_dir(
+    cfg: Config, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(config_module, "_MTIME_SETTLE_NS", 0)
+    (cfg.agents_dir / "cached-agent.md").write_text("# Cached Agent")
+    hits_before = config_module._scan_agent_names.cache_info().hits
+
+    first = cfg.get_all_subagents()
+    second = cfg.get_all_subagents()
+
+    assert first == second
+    assert "cached-agent" in second
+    assert config_module._scan_agent_names.cache_info().hits == hits_before + 1
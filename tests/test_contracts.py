@@ -12,6 +12,8 @@ Contracts in the organic architecture are living documents:
 Contracts enable parallel work by documenting expectations.
 """
 
+from datetime import datetime, timedelta
+
 import pytest
 
 from orchestrator.config import Config
@@ -70,6 +72,21 @@ protocol UserDataProvider {
 
         assert "already exists" in str(exc_info.value)
 
+    def test_similar_names_in_same_second_get_distinct_ids(self, config: Config):
+        """Names that sanitize to the same ID stem should not overwrite each other."""
+        frozen = datetime(2026, 1, 1, 12, 0, 0)
+        contract_manager = ContractManager(config, clock=lambda: frozen)
+
+        first = contract_manager.propose_contract(
+            from_terminal="t1", name="User Profile", contract_type="interface", content="A"
+        )
+        second = contract_manager.propose_contract(
+            from_terminal="t1", name="UserProfile", contract_type="interface", content="B"
+        )
+
+        assert first.id != second.id
+        assert len(contract_manager.list_contracts()) == 2
+
     def test_contract_saved_to_disk(self, contract_manager: ContractManager, config: Config):
         """Contracts should be persisted to disk."""
         _ = config
@@ -260,6 +277,7 @@ class TestContractImplementation:
 
         # c2 should still be pending, c1 is implemented
         assert any(c.name == "Pending2" for c in pending)
+        assert all(c.name != "Pending1" for c in pending)
 
 
 class TestContractVerification:
@@ -321,8 +339,10 @@ class TestContractVerification:
 class TestNegotiationHistoryTracking:
     """Test tracking negotiation history."""
 
-    def test_contract_timestamps_updated(self, contract_manager: ContractManager):
+    def test_contract_timestamps_updated(self, config: Config):
         """Contract timestamps should be updated on changes."""
+        now = [datetime(2026, 1, 1, 12, 0, 0)]
+        contract_manager = ContractManager(config, clock=lambda: now[0])
         contract = contract_manager.propose_contract(
             from_terminal="t1",
             name="TimestampTest",
@@ -333,10 +353,7 @@ class TestNegotiationHistoryTracking:
         original_created = contract.created_at
         original_updated = contract.updated_at
 
-        # Wait and update
-        import time
-
-        time.sleep(0.01)
+        now[0] += timedelta(seconds=1)
 
         updated = contract_manager.respond_to_contract(
             terminal="t2",
@@ -344,7 +361,8 @@ class TestNegotiationHistoryTracking:
             response="Response here",
         )
 
-        assert updated.created_at == original_created
+        assert updated.created_at == original_created == "2026-01-01T12:00:00"
+        assert updated.updated_at == "2026-01-01T12:00:01"
         assert updated.updated_at != original_updated
 
     def test_contract_to_markdown(self, contract_manager: ContractManager):
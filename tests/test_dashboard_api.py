@@ -9,31 +9,59 @@ Verifies all REST endpoints return correct structure and handle edge cases:
 - Input validation (invalid terminal IDs, missing data)
 """
 
+import asyncio
+
 import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 
-from orchestrator.dashboard import app
+from orchestrator import dashboard
+from orchestrator.config import Config
 
 
 @pytest.fixture
-async def client():
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+def client(api_client: AsyncClient, config: Config, monkeypatch: pytest.MonkeyPatch) -> AsyncClient:
+    """Session-wide async HTTP client over the dashboard app.
+
+    The app is built once, but each test points it at its own temporary
+    config, so files written by one test (terminal output, events) never
+    leak into the next or into the real .orchestra directory.
+    """
+    monkeypatch.setattr(dashboard, "config", config)
+    return api_client
 
 
 # =============================================================================
 # GET Endpoints
 # =============================================================================
 
+# Every read-only endpoint with the JSON type its body should have
+_GET_ENDPOINTS: dict[str, type] = {
+    "/api/status": dict,
+    "/api/tasks": dict,
+    "/api/terminals": dict,
+    "/api/messages": dict,
+    **{f"/api/terminal-output/{tid}": dict for tid in ("t1", "t2", "t3", "t4", "t5")},
+    "/api/subagents": dict,
+    "/api/orchestrator-log": dict,
+    "/api/project": dict,
+    "/api/artifacts": list,
+    "/api/events": list,
+}
 
-class TestStatusEndpoint:
-    """Test /api/status endpoint."""
+
+class TestGetEndpoints:
+    """Smoke test for all GET endpoints at once; per-endpoint classes cover payloads."""
 
     @pytest.mark.api
-    async def test_returns_200(self, client: AsyncClient) -> None:
-        response = await client.get("/api/status")
-        assert response.status_code == 200
+    async def test_all_get_endpoints_concurrent(self, client: AsyncClient) -> None:
+        responses = await asyncio.gather(*(client.get(path) for path in _GET_ENDPOINTS))
+        for (path, body_type), response in zip(_GET_ENDPOINTS.items(), responses, strict=True):
+            assert response.status_code == 200, path
+            assert isinstance(response.json(), body_type), path
+
+
+class TestStatusEndpoint:
+    """Test /api/status endpoint."""
 
     @pytest.mark.api
     async def test_contains_required_fields(self, client: AsyncClient) -> None:
@@ -41,11 +69,6 @@ class TestStatusEndpoint:
         data = response.json()
         assert "state" in data
         assert "timestamp" in data
-
-    @pytest.mark.api
-    async def test_contains_project_info(self, client: AsyncClient) -> None:
-        response = await client.get("/api/status")
-        data = response.json()
         assert "project" in data
         assert "name" in data["project"]
 
@@ -54,25 +77,11 @@ class TestTasksEndpoint:
     """Test /api/tasks endpoint."""
 
     @pytest.mark.api
-    async def test_returns_200(self, client: AsyncClient) -> None:
-        response = await client.get("/api/tasks")
-        assert response.status_code == 200
-
-    @pytest.mark.api
-    async def test_contains_all_queues(self, client: AsyncClient) -> None:
-        response = await client.get("/api/tasks")
-        data = response.json()
-        assert "pending" in data
-        assert "in_progress" in data
-        assert "completed" in data
-        assert "failed" in data
-
-    @pytest.mark.api
-    async def test_queues_are_lists(self, client: AsyncClient) -> None:
+    async def test_contains_all_queues_as_lists(self, client: AsyncClient) -> None:
         response = await client.get("/api/tasks")
         data = response.json()
         for key in ["pending", "in_progress", "completed", "failed"]:
-            assert isinstance(data[key], list)
+            assert isinstance(data.get(key), list), key
 
 
 class TestTaskByIdEndpoint:
@@ -88,22 +97,11 @@ class TestTerminalsEndpoint:
     """Test /api/terminals endpoint."""
 
     @pytest.mark.api
-    async def test_returns_200(self, client: AsyncClient) -> None:
-        response = await client.get("/api/terminals")
-        assert response.status_code == 200
-
-    @pytest.mark.api
-    async def test_contains_all_five_terminals(self, client: AsyncClient) -> None:
+    async def test_all_five_terminals_have_role(self, client: AsyncClient) -> None:
         response = await client.get("/api/terminals")
         data = response.json()
         for tid in ["t1", "t2", "t3", "t4", "t5"]:
             assert tid in data
-
-    @pytest.mark.api
-    async def test_terminal_has_role(self, client: AsyncClient) -> None:
-        response = await client.get("/api/terminals")
-        data = response.json()
-        for tid in ["t1", "t2", "t3", "t4", "t5"]:
             assert "role" in data[tid]
             assert "description" in data[tid]
 
@@ -111,11 +109,6 @@ class TestTerminalsEndpoint:
 class TestMessagesEndpoint:
     """Test /api/messages endpoint."""
 
-    @pytest.mark.api
-    async def test_returns_200(self, client: AsyncClient) -> None:
-        response = await client.get("/api/messages")
-        assert response.status_code == 200
-
     @pytest.mark.api
     async def test_returns_dict(self, client: AsyncClient) -> None:
         response = await client.get("/api/messages")
@@ -126,11 +119,6 @@ class TestMessagesEndpoint:
 class TestTerminalOutputEndpoint:
     """Test /api/terminal-output/{terminal_id} endpoint."""
 
-    @pytest.mark.api
-    async def test_valid_terminal_returns_200(self, client: AsyncClient) -> None:
-        response = await client.get("/api/terminal-output/t1")
-        assert response.status_code == 200
-
     @pytest.mark.api
     async def test_invalid_terminal_returns_400(self, client: AsyncClient) -> None:
         response = await client.get("/api/terminal-output/t99")
@@ -144,33 +132,16 @@ class TestTerminalOutputEndpoint:
         assert "output" in data
         assert data["terminal_id"] == "t1"
 
-    @pytest.mark.api
-    @pytest.mark.parametrize("terminal_id", ["t1", "t2", "t3", "t4", "t5"])
-    async def test_all_valid_terminals(self, client: AsyncClient, terminal_id: str) -> None:
-        response = await client.get(f"/api/terminal-output/{terminal_id}")
-        assert response.status_code == 200
-
 
 class TestSubagentsEndpoint:
     """Test /api/subagents endpoint."""
 
     @pytest.mark.api
-    async def test_returns_200(self, client: AsyncClient) -> None:
-        response = await client.get("/api/subagents")
-        assert response.status_code == 200
-
-    @pytest.mark.api
-    async def test_contains_required_keys(self, client: AsyncClient) -> None:
+    async def test_required_keys_and_sorted_available(self, client: AsyncClient) -> None:
         response = await client.get("/api/subagents")
         data = response.json()
         assert "invoked" in data
-        assert "available" in data
         assert "total_invocations" in data
-
-    @pytest.mark.api
-    async def test_available_is_sorted_list(self, client: AsyncClient) -> None:
-        response = await client.get("/api/subagents")
-        data = response.json()
         available = data["available"]
         assert isinstance(available, list)
         assert available == sorted(available)
@@ -179,11 +150,6 @@ class TestSubagentsEndpoint:
 class TestOrchestratorLogEndpoint:
     """Test /api/orchestrator-log endpoint."""
 
-    @pytest.mark.api
-    async def test_returns_200(self, client: AsyncClient) -> None:
-        response = await client.get("/api/orchestrator-log")
-        assert response.status_code == 200
-
     @pytest.mark.api
     async def test_response_structure(self, client: AsyncClient) -> None:
         response = await client.get("/api/orchestrator-log")
@@ -196,11 +162,6 @@ class TestOrchestratorLogEndpoint:
 class TestProjectEndpoint:
     """Test /api/project endpoint."""
 
-    @pytest.mark.api
-    async def test_returns_200(self, client: AsyncClient) -> None:
-        response = await client.get("/api/project")
-        assert response.status_code == 200
-
     @pytest.mark.api
     async def test_contains_name(self, client: AsyncClient) -> None:
         response = await client.get("/api/project")
@@ -211,11 +172,6 @@ class TestProjectEndpoint:
 class TestArtifactsEndpoint:
     """Test /api/artifacts endpoint."""
 
-    @pytest.mark.api
-    async def test_returns_200(self, client: AsyncClient) -> None:
-        response = await client.get("/api/artifacts")
-        assert response.status_code == 200
-
     @pytest.mark.api
     async def test_returns_list(self, client: AsyncClient) -> None:
         response = await client.get("/api/artifacts")
@@ -226,11 +182,6 @@ class TestArtifactsEndpoint:
 class TestEventsEndpoint:
     """Test /api/events endpoint."""
 
-    @pytest.mark.api
-    async def test_returns_200(self, client: AsyncClient) -> None:
-        response = await client.get("/api/events")
-        assert response.status_code == 200
-
     @pytest.mark.api
     async def test_returns_list(self, client: AsyncClient) -> None:
         response = await client.get("/api/events")
@@ -284,17 +235,21 @@ class TestInputValidation:
 
     @pytest.mark.api
     @pytest.mark.security
-    async def test_terminal_id_injection_attempt(self, client: AsyncClient) -> None:
-        """Path traversal in terminal_id should be rejected."""
-        response = await client.get("/api/terminal-output/../../../etc/passwd")
-        assert response.status_code in (400, 404, 422)
-
-    @pytest.mark.api
-    @pytest.mark.security
-    async def test_terminal_id_special_chars(self, client: AsyncClient) -> None:
-        """Special characters in terminal_id should be rejected."""
-        response = await client.get("/api/terminal-output/t1%00")
-        assert response.status_code in (400, 404, 422)
+    @pytest.mark.parametrize(
+        "path,allowed",
+        [
+            ("/api/terminal-output/../../../etc/passwd", {400, 404, 422}),
+            ("/api/terminal-output/t1%00", {400, 404, 422}),
+            ("/api/tasks/<script>alert(1)</script>", {404, 422}),
+        ],
+        ids=["terminal-path-traversal", "terminal-null-byte", "task-script-tag"],
+    )
+    async def test_malicious_path_rejected(
+        self, client: AsyncClient, path: str, allowed: set[int]
+    ) -> None:
+        """Traversal and special characters in path params are rejected, not served."""
+        response = await client.get(path)
+        assert response.status_code in allowed
 
     @pytest.mark.api
     @pytest.mark.security
@@ -302,10 +257,3 @@ class TestInputValidation:
         """Very large max_lines should not crash the server."""
         response = await client.get("/api/terminal-output/t1?max_lines=999999")
         assert response.status_code == 200
-
-    @pytest.mark.api
-    @pytest.mark.security
-    async def test_task_id_with_special_chars(self, client: AsyncClient) -> None:
-        """Task ID with special chars should return 404, not crash."""
-        response = await client.get("/api/tasks/<script>alert(1)</script>")
-        assert response.status_code in (404, 422)
@@ -15,36 +15,51 @@ All responses match the OpenAPI spec in .orchestra/contracts/api-openapi.yaml
 and T1's APIClient SDK in orchestrator/api_client.py.
 """
 
+import asyncio
+from typing import Any
+
 import pytest
-from httpx import ASGITransport, AsyncClient
+from fastapi import FastAPI
+from httpx import AsyncClient
 
 from orchestrator.auth.config import AuthConfig
-from orchestrator.live_api import create_live_api
+from orchestrator.auth.models import Role, User
+from orchestrator.auth.passwords import PasswordHasher
+from orchestrator.live_api import ErrorResponseSchema, LiveAPIState
 
 
 # ─── Fixtures ─────────────────────────────────────────────────────────────
 
 
-def _create_test_app() -> AsyncClient:
-    """Create a fresh live API app with in-memory database."""
-    config = AuthConfig(
-        secret_key="live-api-test-secret-key-min-32bytes",
-        access_token_expire_minutes=30,
-        refresh_token_expire_days=7,
-        db_path=":memory:",
-        min_password_length=8,
-    )
-    app = create_live_api(auth_config=config, db_path=":memory:")
-    return app
+@pytest.fixture
+def client(live_api_client: AsyncClient) -> AsyncClient:
+    """Session-wide live API client, reset per test (see conftest)."""
+    return live_api_client
 
 
 @pytest.fixture
-async def client():
-    """Async HTTP client for the live API."""
-    app = _create_test_app()
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+def alice_tokens(
+    # Requested only so the per-test state reset runs before Alice is created
+    live_api_client: AsyncClient,  # noqa: ARG001
+    live_api_env: tuple[FastAPI, LiveAPIState],
+    memoized_hasher: PasswordHasher,
+) -> dict[str, Any]:
+    """Token pair for Alice, the first user, created directly in the database.
+
+    Matches what registering the first user does (admin role, seeded
+    resources) without the register and login round-trips; the tests for
+    those endpoints still go through HTTP.
+    """
+    _, state = live_api_env
+    user = User(
+        username="Alice",
+        email="alice@example.com",
+        hashed_password=memoized_hasher.hash("SecurePass123!"),
+        role=Role.ADMIN,
+    )
+    state.user_db.create_user(user)
+    state.resource_db.seed_if_empty(user.id)
+    return state.token_service.create_token_pair(user.id, "admin")
 
 
 # ─── Helpers ──────────────────────────────────────────────────────────────
@@ -150,8 +165,8 @@ class TestRegister:
         data = await _register(client, "second@example.com", "Pass12345!", "Second")
         assert data["user"]["role"] == "user"
 
+    @pytest.mark.usefixtures("alice_tokens")
     async def test_duplicate_email_rejected(self, client: AsyncClient) -> None:
-        await _register(client)
         resp = await client.post("/api/v1/auth/register", json={
             "email": "alice@example.com",
             "password": "AnotherPass123!",
@@ -195,8 +210,8 @@ class TestRegister:
 
 
 class TestLogin:
+    @pytest.mark.usefixtures("alice_tokens")
     async def test_successful_login(self, client: AsyncClient) -> None:
-        await _register(client)
         resp = await client.post("/api/v1/auth/login", json={
             "email": "alice@example.com",
             "password": "SecurePass123!",
@@ -210,8 +225,8 @@ class TestLogin:
         assert data["user"]["email"] == "alice@example.com"
         assert data["tokens"]["token_type"] == "bearer"
 
+    @pytest.mark.usefixtures("alice_tokens")
     async def test_wrong_password_rejected(self, client: AsyncClient) -> None:
-        await _register(client)
         resp = await client.post("/api/v1/auth/login", json={
             "email": "alice@example.com",
             "password": "WrongPassword123!",
@@ -219,19 +234,11 @@ class TestLogin:
         assert resp.status_code == 401
         assert resp.json()["error"]["code"] == "INVALID_CREDENTIALS"
 
-    async def test_nonexistent_email_rejected(self, client: AsyncClient) -> None:
-        resp = await client.post("/api/v1/auth/login", json={
-            "email": "ghost@example.com",
-            "password": "SecurePass123!",
-        })
-        assert resp.status_code == 401
-        assert resp.json()["error"]["code"] == "INVALID_CREDENTIALS"
-
+    @pytest.mark.usefixtures("alice_tokens")
     async def test_same_error_for_wrong_email_and_password(
         self, client: AsyncClient,
     ) -> None:
         """Prevents user enumeration."""
-        await _register(client)
         r1 = await client.post("/api/v1/auth/login", json={
             "email": "wrong@example.com",
             "password": "SecurePass123!",
@@ -260,10 +267,9 @@ class TestLogin:
 
 
 class TestRefresh:
-    async def test_successful_refresh(self, client: AsyncClient) -> None:
-        auth = await _register_and_login(client)
+    async def test_successful_refresh(self, client: AsyncClient, alice_tokens: dict) -> None:
         resp = await client.post("/api/v1/auth/refresh", json={
-            "refresh_token": auth["tokens"]["refresh_token"],
+            "refresh_token": alice_tokens["refresh_token"],
         })
         assert resp.status_code == 200
         data = resp.json()
@@ -272,10 +278,9 @@ class TestRefresh:
         assert data["token_type"] == "bearer"
 
     async def test_old_refresh_token_revoked_after_rotation(
-        self, client: AsyncClient,
+        self, client: AsyncClient, alice_tokens: dict,
     ) -> None:
-        auth = await _register_and_login(client)
-        old_refresh = auth["tokens"]["refresh_token"]
+        old_refresh = alice_tokens["refresh_token"]
 
         # Use the refresh token
         resp = await client.post("/api/v1/auth/refresh", json={
@@ -290,26 +295,16 @@ class TestRefresh:
         assert resp2.status_code == 401
 
     async def test_access_token_as_refresh_rejected(
-        self, client: AsyncClient,
+        self, client: AsyncClient, alice_tokens: dict,
     ) -> None:
-        auth = await _register_and_login(client)
         resp = await client.post("/api/v1/auth/refresh", json={
-            "refresh_token": auth["tokens"]["access_token"],
+            "refresh_token": alice_tokens["access_token"],
         })
         assert resp.status_code == 401
 
-    async def test_invalid_refresh_token_rejected(
-        self, client: AsyncClient,
-    ) -> None:
+    async def test_new_tokens_work(self, client: AsyncClient, alice_tokens: dict) -> None:
         resp = await client.post("/api/v1/auth/refresh", json={
-            "refresh_token": "not.a.valid.token",
-        })
-        assert resp.status_code == 401
-
-    async def test_new_tokens_work(self, client: AsyncClient) -> None:
-        auth = await _register_and_login(client)
-        resp = await client.post("/api/v1/auth/refresh", json={
-            "refresh_token": auth["tokens"]["refresh_token"],
+            "refresh_token": alice_tokens["refresh_token"],
         })
         new_tokens = resp.json()
 
@@ -326,26 +321,14 @@ class TestRefresh:
 
 
 class TestLogout:
-    async def test_successful_logout(self, client: AsyncClient) -> None:
-        auth = await _register_and_login(client)
+    async def test_successful_logout(self, client: AsyncClient, alice_tokens: dict) -> None:
         resp = await client.delete(
             "/api/v1/auth/logout",
-            headers=_auth_header(auth["tokens"]["access_token"]),
+            headers=_auth_header(alice_tokens["access_token"]),
         )
         assert resp.status_code == 200
         assert "logged out" in resp.json()["message"].lower()
 
-    async def test_logout_requires_auth(self, client: AsyncClient) -> None:
-        resp = await client.delete("/api/v1/auth/logout")
-        assert resp.status_code == 401
-
-    async def test_logout_with_invalid_token(self, client: AsyncClient) -> None:
-        resp = await client.delete(
-            "/api/v1/auth/logout",
-            headers=_auth_header("invalid.token.here"),
-        )
-        assert resp.status_code == 401
-
 
 # ═══════════════════════════════════════════════════════════════════════════
 # GET /users/me
@@ -353,11 +336,10 @@ class TestLogout:
 
 
 class TestGetMe:
-    async def test_get_me_returns_user(self, client: AsyncClient) -> None:
-        auth = await _register_and_login(client)
+    async def test_get_me_returns_user(self, client: AsyncClient, alice_tokens: dict) -> None:
         resp = await client.get(
             "/api/v1/users/me",
-            headers=_auth_header(auth["tokens"]["access_token"]),
+            headers=_auth_header(alice_tokens["access_token"]),
         )
         assert resp.status_code == 200
         data = resp.json()
@@ -367,17 +349,6 @@ class TestGetMe:
         assert "created_at" in data
         assert "hashed_password" not in data
 
-    async def test_get_me_without_token(self, client: AsyncClient) -> None:
-        resp = await client.get("/api/v1/users/me")
-        assert resp.status_code == 401
-
-    async def test_get_me_with_invalid_token(self, client: AsyncClient) -> None:
-        resp = await client.get(
-            "/api/v1/users/me",
-            headers=_auth_header("totally.invalid.token"),
-        )
-        assert resp.status_code == 401
-
 
 # ═══════════════════════════════════════════════════════════════════════════
 # PUT /users/me
@@ -385,44 +356,37 @@ class TestGetMe:
 
 
 class TestUpdateMe:
-    async def test_update_name(self, client: AsyncClient) -> None:
-        auth = await _register_and_login(client)
+    async def test_update_name(self, client: AsyncClient, alice_tokens: dict) -> None:
         resp = await client.put(
             "/api/v1/users/me",
             json={"name": "Alice Updated"},
-            headers=_auth_header(auth["tokens"]["access_token"]),
+            headers=_auth_header(alice_tokens["access_token"]),
         )
         assert resp.status_code == 200
         assert resp.json()["name"] == "Alice Updated"
 
-    async def test_update_email(self, client: AsyncClient) -> None:
-        auth = await _register_and_login(client)
+    async def test_update_email(self, client: AsyncClient, alice_tokens: dict) -> None:
         resp = await client.put(
             "/api/v1/users/me",
             json={"email": "newalice@example.com"},
-            headers=_auth_header(auth["tokens"]["access_token"]),
+            headers=_auth_header(alice_tokens["access_token"]),
         )
         assert resp.status_code == 200
         assert resp.json()["email"] == "newalice@example.com"
 
-    async def test_update_both(self, client: AsyncClient) -> None:
-        auth = await _register_and_login(client)
+    async def test_update_both(self, client: AsyncClient, alice_tokens: dict) -> None:
         resp = await client.put(
             "/api/v1/users/me",
             json={"name": "New Name", "email": "new@example.com"},
-            headers=_auth_header(auth["tokens"]["access_token"]),
+            headers=_auth_header(alice_tokens["access_token"]),
         )
         assert resp.status_code == 200
         data = resp.json()
         assert data["name"] == "New Name"
         assert data["email"] == "new@example.com"
 
-    async def test_update_requires_auth(self, client: AsyncClient) -> None:
-        resp = await client.put("/api/v1/users/me", json={"name": "X"})
-        assert resp.status_code == 401
-
+    @pytest.mark.usefixtures("alice_tokens")
     async def test_email_conflict_rejected(self, client: AsyncClient) -> None:
-        await _register(client, "alice@example.com", "Pass12345!", "Alice")
         auth = await _register_and_login(
             client, "bob@example.com", "Pass12345!", "Bob"
         )
@@ -441,11 +405,10 @@ class TestUpdateMe:
 
 
 class TestResources:
-    async def test_list_resources(self, client: AsyncClient) -> None:
-        auth = await _register_and_login(client)
+    async def test_list_resources(self, client: AsyncClient, alice_tokens: dict) -> None:
         resp = await client.get(
             "/api/v1/resources",
-            headers=_auth_header(auth["tokens"]["access_token"]),
+            headers=_auth_header(alice_tokens["access_token"]),
         )
         assert resp.status_code == 200
         data = resp.json()
@@ -455,11 +418,12 @@ class TestResources:
         assert data["meta"]["page"] == 1
         assert data["meta"]["per_page"] == 20
 
-    async def test_resources_have_correct_shape(self, client: AsyncClient) -> None:
-        auth = await _register_and_login(client)
+    async def test_resources_have_correct_shape(
+        self, client: AsyncClient, alice_tokens: dict,
+    ) -> None:
         resp = await client.get(
             "/api/v1/resources",
-            headers=_auth_header(auth["tokens"]["access_token"]),
+            headers=_auth_header(alice_tokens["access_token"]),
         )
         data = resp.json()
         assert len(data["data"]) > 0
@@ -471,30 +435,81 @@ class TestResources:
         assert "owner_id" in resource
         assert "created_at" in resource
 
-    async def test_resources_require_auth(self, client: AsyncClient) -> None:
-        resp = await client.get("/api/v1/resources")
-        assert resp.status_code == 401
-
-    async def test_pagination_params(self, client: AsyncClient) -> None:
-        auth = await _register_and_login(client)
+    async def test_pagination_params(self, client: AsyncClient, alice_tokens: dict) -> None:
         resp = await client.get(
             "/api/v1/resources?page=1&per_page=2",
-            headers=_auth_header(auth["tokens"]["access_token"]),
+            headers=_auth_header(alice_tokens["access_token"]),
         )
         assert resp.status_code == 200
         data = resp.json()
         assert data["meta"]["per_page"] == 2
         assert len(data["data"]) <= 2
 
-    async def test_pagination_total(self, client: AsyncClient) -> None:
-        auth = await _register_and_login(client)
-        resp = await client.get(
-            "/api/v1/resources",
-            headers=_auth_header(auth["tokens"]["access_token"]),
-        )
-        data = resp.json()
-        assert data["meta"]["total"] == 5  # 5 seed resources
-        assert data["meta"]["total_pages"] == 1
+    @pytest.mark.usefixtures("alice_tokens")
+    def test_pagination_total(self, live_api_env: tuple[FastAPI, LiveAPIState]) -> None:
+        """Totals come straight from the resource table; the HTTP shape is covered above."""
+        _, state = live_api_env
+        meta = state.resource_db.list_resources()["meta"]
+        assert meta["total"] == 5  # 5 seed resources
+        assert meta["total_pages"] == 1
+        assert state.resource_db.list_resources(per_page=2)["meta"]["total_pages"] == 3
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Rejected Credentials
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestRejectedCredentials:
+    @pytest.mark.parametrize(
+        "method,path,kwargs,code",
+        [
+            (
+                "POST",
+                "/api/v1/auth/login",
+                {"json": {"email": "ghost@example.com", "password": "SecurePass123!"}},
+                "INVALID_CREDENTIALS",
+            ),
+            (
+                "POST",
+                "/api/v1/auth/refresh",
+                {"json": {"refresh_token": "not.a.valid.token"}},
+                "INVALID_TOKEN",
+            ),
+            ("DELETE", "/api/v1/auth/logout", {}, "UNAUTHORIZED"),
+            (
+                "DELETE",
+                "/api/v1/auth/logout",
+                {"headers": _auth_header("invalid.token")},
+                "UNAUTHORIZED",
+            ),
+            ("GET", "/api/v1/users/me", {}, "UNAUTHORIZED"),
+            ("GET", "/api/v1/users/me", {"headers": _auth_header("invalid.token")}, "UNAUTHORIZED"),
+            ("PUT", "/api/v1/users/me", {"json": {"name": "X"}}, "UNAUTHORIZED"),
+            ("GET", "/api/v1/resources", {}, "UNAUTHORIZED"),
+        ],
+        ids=[
+            "login-nonexistent-email",
+            "refresh-invalid-token",
+            "logout-no-token",
+            "logout-invalid-token",
+            "me-no-token",
+            "me-invalid-token",
+            "update-me-no-token",
+            "resources-no-token",
+        ],
+    )
+    async def test_bad_auth_returns_401(
+        self,
+        client: AsyncClient,
+        method: str,
+        path: str,
+        kwargs: dict,
+        code: str,
+    ) -> None:
+        resp = await client.request(method, path, **kwargs)
+        assert resp.status_code == 401
+        assert resp.json()["error"]["code"] == code
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -510,23 +525,20 @@ class TestErrorFormat:
             "email": "x@x.com",
             "password": "wrong",
         })
-        data = resp.json()
-        assert "error" in data
-        assert "code" in data["error"]
-        assert "message" in data["error"]
+        error = ErrorResponseSchema.model_validate_json(resp.content).error
+        assert error.code
+        assert error.message
 
     async def test_validation_error_format(self, client: AsyncClient) -> None:
         resp = await client.post("/api/v1/auth/register", json={})
-        data = resp.json()
-        assert "error" in data
-        assert data["error"]["code"] == "VALIDATION_ERROR"
-        assert "details" in data["error"]
+        error = ErrorResponseSchema.model_validate_json(resp.content).error
+        assert error.code == "VALIDATION_ERROR"
+        assert error.details
 
     async def test_unauthorized_error_format(self, client: AsyncClient) -> None:
         resp = await client.get("/api/v1/users/me")
-        data = resp.json()
-        assert "error" in data
-        assert data["error"]["code"] == "UNAUTHORIZED"
+        error = ErrorResponseSchema.model_validate_json(resp.content).error
+        assert error.code == "UNAUTHORIZED"
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -564,18 +576,18 @@ class TestFullLifecycle:
         assert login.status_code == 200
         login_tokens = login.json()["tokens"]
 
-        # 4. List resources
-        resources = await client.get(
-            "/api/v1/resources",
-            headers=_auth_header(login_tokens["access_token"]),
+        # 4. List resources and 5. refresh - independent, so run together
+        resources, refresh = await asyncio.gather(
+            client.get(
+                "/api/v1/resources",
+                headers=_auth_header(login_tokens["access_token"]),
+            ),
+            client.post("/api/v1/auth/refresh", json={
+                "refresh_token": login_tokens["refresh_token"],
+            }),
         )
         assert resources.status_code == 200
         assert len(resources.json()["data"]) > 0
-
-        # 5. Refresh
-        refresh = await client.post("/api/v1/auth/refresh", json={
-            "refresh_token": login_tokens["refresh_token"],
-        })
         assert refresh.status_code == 200
         new_tokens = refresh.json()
 
@@ -596,21 +608,72 @@ class TestFullLifecycle:
         assert logout.status_code == 200
 
     async def test_multiple_users_isolated(self, client: AsyncClient) -> None:
-        auth_a = await _register_and_login(
-            client, "alice@example.com", "Pass12345!", "Alice"
-        )
-        auth_b = await _register_and_login(
-            client, "bob@example.com", "Pass12345!", "Bob"
+        auth_a, auth_b = await asyncio.gather(
+            _register_and_login(client, "alice@example.com", "Pass12345!", "Alice"),
+            _register_and_login(client, "bob@example.com", "Pass12345!", "Bob"),
         )
 
-        me_a = await client.get(
-            "/api/v1/users/me",
-            headers=_auth_header(auth_a["tokens"]["access_token"]),
-        )
-        me_b = await client.get(
-            "/api/v1/users/me",
-            headers=_auth_header(auth_b["tokens"]["access_token"]),
+        me_a, me_b = await asyncio.gather(
+            client.get(
+                "/api/v1/users/me",
+                headers=_auth_header(auth_a["tokens"]["access_token"]),
+            ),
+            client.get(
+                "/api/v1/users/me",
+                headers=_auth_header(auth_b["tokens"]["access_token"]),
+            ),
         )
 
         assert me_a.json()["name"] == "Alice"
         assert me_b.json()["name"] == "Bob"
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# State Reset
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestStateReset:
+    async def test_reset_clears_users_resources_and_revocations(
+        self, client: AsyncClient, live_api_env: tuple[FastAPI, LiveAPIState],
+    ) -> None:
+        _, state = live_api_env
+        auth = await _register_and_login(client)
+        await client.post("/api/v1/auth/refresh", json={
+            "refresh_token": auth["tokens"]["refresh_token"],
+        })
+
+        state.reset()
+
+        assert state.user_db.count_users() == 0
+        assert state.resource_db.list_resources()["meta"]["total"] == 0
+        assert not state.token_service.is_revoked(auth["tokens"]["refresh_token"])
+
+
+class TestInMemoryDatabase:
+    def test_memory_db_skips_durability(self) -> None:
+        state = LiveAPIState(
+            auth_config=AuthConfig(secret_key="live-api-test-secret-key-min-32bytes"),
+            db_path=":memory:",
+        )
+        assert state._conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+        assert state._conn.execute("PRAGMA locking_mode").fetchone()[0] == "exclusive"
+
+    def test_user_db_shares_the_state_connection(self) -> None:
+        state = LiveAPIState(
+            auth_config=AuthConfig(secret_key="live-api-test-secret-key-min-32bytes"),
+            db_path=":memory:",
+        )
+        assert state.user_db._conn is state._conn
+
+
+class TestPasswordHashing:
+    def test_hasher_uses_configured_rounds(self) -> None:
+        state = LiveAPIState(
+            auth_config=AuthConfig(
+                secret_key="live-api-test-secret-key-min-32bytes",
+                password_hash_rounds=4,
+            ),
+            db_path=":memory:",
+        )
+        assert state.hasher.hash("SecurePass123!").startswith("$2b$04$")
@@ -48,6 +48,19 @@ class TestEventDataclass:
         assert event.terminal is None
         assert event.details is None
 
+    def test_to_dict_round_trips(self) -> None:
+        """to_dict should carry every field, so Event(**d) rebuilds the event."""
+        event = Event(
+            timestamp="2024-01-01T00:00:00",
+            type="task_failed",
+            terminal="t2",
+            task_id="task_002",
+            task_title="Build API",
+            message="Failed",
+            details={"error": "Timeout"},
+        )
+        assert Event(**event.to_dict()) == event
+
 
 class TestEventLoggerInit:
     """Test EventLogger initialization and persistence."""
@@ -13,6 +13,9 @@ Critical edge cases:
 - Message IDs are unique across rapid successive calls
 """
 
+import fcntl
+import threading
+
 from orchestrator.config import Config
 from orchestrator.message_bus import Message, MessageBus
 
@@ -206,6 +209,13 @@ class TestMessageIDUniqueness:
 
         assert len(ids) == 10, "All 10 message IDs should be unique"
 
+    def test_ids_unique_across_bus_instances(self, config: Config) -> None:
+        """Buses created back to back must not hand out the same IDs."""
+        first = MessageBus(config).send(sender="t1", recipient="t2", content="a")
+        second = MessageBus(config).send(sender="t1", recipient="t2", content="b")
+
+        assert first.id != second.id
+
 
 class TestInboxManagement:
     """Test inbox clearing and management."""
@@ -251,6 +261,41 @@ class TestInboxManagement:
         assert "First message" in inbox
         assert "Second message" in inbox
 
+    def test_placeholder_text_in_content_keeps_history(self, config: Config) -> None:
+        """A message quoting the placeholder should not wipe earlier messages."""
+        bus = MessageBus(config)
+
+        bus.send(sender="t1", recipient="t2", content="First message")
+        bus.send(sender="t3", recipient="t2", content="No messages yet.")
+        bus.send(sender="t1", recipient="t2", content="Third message")
+
+        inbox = bus.read_inbox("t2")
+        assert inbox.startswith("# Inbox\n\n")
+        assert "First message" in inbox
+        assert "Third message" in inbox
+
+    def test_send_waits_for_inbox_lock(self, config: Config) -> None:
+        """A send should not check or rewrite the inbox while another sender holds it."""
+        bus = MessageBus(config)
+        inbox_path = config.get_terminal_inbox("t2")
+
+        with inbox_path.open("a") as held:
+            fcntl.flock(held.fileno(), fcntl.LOCK_EX)
+            sender = threading.Thread(
+                target=bus.send, kwargs={"sender": "t1", "recipient": "t2", "content": "Queued"}
+            )
+            sender.start()
+            sender.join(timeout=0.2)
+            assert sender.is_alive()
+            held.write("---\n## Message: held\n")
+            held.flush()
+            fcntl.flock(held.fileno(), fcntl.LOCK_UN)
+        sender.join(timeout=5)
+
+        inbox = bus.read_inbox("t2")
+        assert "## Message: held" in inbox
+        assert "Queued" in inbox
+
 
 class TestMessageMetadata:
     """Test message metadata handling."""